@@ -6,7 +6,7 @@ to help with newsletter curation and article organization.
 """
 
 import re
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set
 
 # Geographic mapping: cities, countries, regions -> continents
 GEOGRAPHIC_MAPPING = {
@@ -198,13 +198,16 @@ def get_core_topic_categories(matched_keywords: List[str]) -> List[str]:
     
     return list(categories)
 
-def tag_article(article_content: str, keywords_list: List[str]) -> Dict[str, List[str]]:
+def tag_article(article_content: str, keywords_list: List[str],
+                matched_keywords: Optional[List[str]] = None) -> Dict[str, List[str]]:
     """
     Main function to tag an article with all relevant tags.
     
     Args:
         article_content: The full text content of the article
         keywords_list: List of keywords to check against
+        matched_keywords: Keywords the caller already found in article_content
+            (skips the keyword scan)
         
     Returns:
         Dictionary with tagging results:
@@ -214,7 +217,8 @@ def tag_article(article_content: str, keywords_list: List[str]) -> Dict[str, Lis
             'core_topics': List[str]
         }
     """
-    matched_keywords = get_matched_keywords(article_content, keywords_list)
+    if matched_keywords is None:
+        matched_keywords = get_matched_keywords(article_content, keywords_list)
     
     return {
         'continents': detect_continents(article_content),
@@ -9,33 +9,38 @@ storage utilities as news_scraper.py but does not filter by keywords.
 
 import os
 import re
-import json
-import time
+import orjson
 import logging
-import requests
-import hashlib
 import sys
 import argparse
+import atexit
+import threading
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional
+from dateutil import parser as date_parser
+from dateutil.tz import tzutc
+from typing import Optional
 from urllib.parse import urljoin, urlparse, quote
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from concurrent.futures import ThreadPoolExecutor
 
 # Import shared storage utilities
 from news_storage import (
     save_article,
+    url_hash,
+    legacy_url_hash,
+    flush_daily_manifest,
     get_today_folder,
-    exists_in_s3,
+    s3_client,
     S3_BUCKET_NAME
 )
 
+# Import shared HTTP sessions, per-host limits and HTML helpers
+from news_fetch import http_get, url_host, node_text, decode_html, fetch_html, parse_feed_items
+
 # Import tagging functionality
 from article_tagger import tag_article, detect_continents
 
-# Import progress tracking (we'll create a shared one or duplicate the class)
-import json as json_module
-
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("legislation_scraper")
 
@@ -51,18 +56,26 @@ if not os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
 
 # Track progress
 PROGRESS_FILE = "/tmp/legislation_scraper_progress.json" if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') else "legislation_scraper_progress.json"
+# Progress writes are batched so a busy run rewrites the file at most once every two seconds
+PROGRESS_FLUSH_INTERVAL = 2.0
 
 # Progress tracking class (duplicated from news_scraper or could be extracted)
 class ProgressTracker:
     def __init__(self, progress_file=PROGRESS_FILE):
         self.progress_file = progress_file
         self.progress = self.load_progress()
+        # Feeds and their articles are processed on thread pools
+        self.lock = threading.RLock()
+        # Writes are debounced: mutators mark the tracker dirty and a timer
+        # flushes to disk at most once per PROGRESS_FLUSH_INTERVAL
+        self._dirty = False
+        self._flush_timer = None
     
     def load_progress(self):
         """Load progress from file or initialize new"""
         if os.path.exists(self.progress_file):
-            with open(self.progress_file, 'r') as f:
-                return json_module.load(f)
+            with open(self.progress_file, 'rb') as f:
+                return orjson.loads(f.read())
         return {
             "rss_feeds": {"feeds_completed": []},
             "total_articles": 0,
@@ -70,16 +83,36 @@ class ProgressTracker:
         }
     
     def save_progress(self):
-        """Save current progress"""
-        self.progress["last_updated"] = datetime.now().isoformat()
-        with open(self.progress_file, 'w') as f:
-            json_module.dump(self.progress, f, indent=2)
+        """Schedule a write of the current progress"""
+        with self.lock:
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(PROGRESS_FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush(self):
+        """Write progress to disk if anything changed since the last write"""
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self.progress["last_updated"] = datetime.now().isoformat()
+            # Write-then-rename so a crash mid-write never leaves a truncated file
+            tmp_file = self.progress_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(self.progress, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, self.progress_file)
+            self._dirty = False
     
     def mark_feed_complete(self, feed_url):
         """Mark a feed as completed"""
-        if feed_url not in self.progress["rss_feeds"]["feeds_completed"]:
-            self.progress["rss_feeds"]["feeds_completed"].append(feed_url)
-            self.save_progress()
+        with self.lock:
+            if feed_url not in self.progress["rss_feeds"]["feeds_completed"]:
+                self.progress["rss_feeds"]["feeds_completed"].append(feed_url)
+                self.save_progress()
     
     def is_feed_complete(self, feed_url):
         """Check if feed was already processed"""
@@ -88,30 +121,35 @@ class ProgressTracker:
         return feed_url in self.progress["rss_feeds"].get("feeds_completed", [])
 
 progress_tracker = ProgressTracker()
+atexit.register(progress_tracker.flush)
 
-# URL deduplication tracking
+# URL deduplication tracking, by article ID (the url_hash of the URL that
+# save_article also uses as the metadata file name)
 processed_urls = set()
 
 def url_already_processed(url: str) -> bool:
     """Check if URL was already processed"""
     if FRESH_MODE:
         return False
-    return url in processed_urls
+    return url_hash(url) in processed_urls or legacy_url_hash(url) in processed_urls
 
 def add_processed_url(url: str):
     """Add URL to processed set"""
-    processed_urls.add(url)
+    processed_urls.add(url_hash(url))
 
 # Track processed URLs from S3
 def load_processed_urls():
-    """Load processed URLs from S3 metadata files"""
-    global processed_urls
+    """
+    Load processed article IDs from today's S3 metadata file names.
+    
+    Metadata files are named <article_id>.json, so listing the keys is enough
+    and no metadata object has to be downloaded.
+    """
     today_folder = get_today_folder()
     
     try:
-        import boto3
-        s3 = boto3.client('s3')
-        paginator = s3.get_paginator('list_objects_v2')
+        # Reuse the shared storage client (and its connection pool)
+        paginator = s3_client.get_paginator('list_objects_v2')
         pages = paginator.paginate(
             Bucket=S3_BUCKET_NAME,
             Prefix=f"{today_folder}/"
@@ -122,15 +160,9 @@ def load_processed_urls():
                 continue
             
             for obj in page['Contents']:
-                if obj['Key'].endswith('.json') and '/metadata/' in obj['Key']:
-                    try:
-                        response = s3.get_object(Bucket=S3_BUCKET_NAME, Key=obj['Key'])
-                        metadata = json_module.loads(response['Body'].read().decode('utf-8'))
-                        if 'url' in metadata:
-                            processed_urls.add(metadata['url'])
-                    except Exception as e:
-                        logger.debug(f"Error loading metadata {obj['Key']}: {e}")
-                        continue
+                key = obj['Key']
+                if key.endswith('.json') and '/metadata/' in key:
+                    processed_urls.add(key.rsplit('/', 1)[-1][:-len('.json')])
         
         logger.info(f"Loaded {len(processed_urls)} processed URLs from S3")
     except Exception as e:
@@ -178,11 +210,8 @@ def is_recent_article(pub_date: str, days: int = 1) -> bool:
         return True  # If no date, include it (assume recent)
     
     try:
-        from dateutil import parser
-        from dateutil.tz import tzutc
-        
         # Parse the publication date
-        parsed_date = parser.parse(pub_date)
+        parsed_date = date_parser.parse(pub_date)
         
         # Make timezone-aware if not already
         if parsed_date.tzinfo is None:
@@ -221,13 +250,21 @@ def is_recent_article(pub_date: str, days: int = 1) -> bool:
 # CONTENT EXTRACTION
 # -------------------------------------------------------------------------
 
+# Main article containers, most specific first
+ARTICLE_SELECTORS = [
+    'article',
+    '.article-content',
+    '.article-body',
+    '.post-content',
+    '.entry-content',
+    'main',
+    '#content',
+    '.content',
+]
+
 def extract_full_article_content(url: str) -> Optional[str]:
     """Extract full article content from URL"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
         # Special handling for govinfo.gov - extract bill ID and get XML/HTML content
         if 'govinfo.gov/app/details/' in url:
             # Extract bill ID from URL (e.g., BILLS-119hr5853ih from /app/details/BILLS-119hr5853ih)
@@ -236,7 +273,7 @@ def extract_full_article_content(url: str) -> Optional[str]:
                 # Try XML first (cleanest format)
                 xml_url = f"https://www.govinfo.gov/content/pkg/{bill_id}/xml/{bill_id}.xml"
                 try:
-                    xml_response = requests.get(xml_url, headers=headers, timeout=30)
+                    xml_response = http_get(xml_url, timeout=30)
                     if xml_response.status_code == 200 and len(xml_response.content) > 1000:
                         # Parse XML and convert to HTML-like structure
                         soup = BeautifulSoup(xml_response.content, 'xml')
@@ -250,40 +287,32 @@ def extract_full_article_content(url: str) -> Optional[str]:
                 # Fallback to HTML version
                 html_url = f"https://www.govinfo.gov/content/pkg/{bill_id}/html/{bill_id}.htm"
                 try:
-                    html_response = requests.get(html_url, headers=headers, timeout=30)
+                    html_response = http_get(html_url, timeout=30)
                     if html_response.status_code == 200 and len(html_response.content) > 1000:
-                        soup = BeautifulSoup(html_response.content, 'html.parser')
+                        tree = LexborHTMLParser(decode_html(html_response, html_response.content))
                         # Get the body content
-                        body = soup.find('body')
-                        if body:
-                            return str(body)
+                        if tree.body:
+                            return tree.body.html
                 except Exception as e:
                     logger.debug(f"Could not get HTML for {bill_id}: {e}")
         
         # Special handling for Brazilian Senate (senado.leg.br) - extract from #textoMateria
-        if 'senado.leg.br' in url:
+        if url_host(url).endswith('senado.leg.br'):
             try:
-                response = requests.get(url, headers=headers, timeout=30)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                tree = LexborHTMLParser(fetch_html(url, timeout=30) or '')
                 
                 # Remove scripts and styles
-                for script in soup(["script", "style"]):
-                    script.decompose()
+                tree.strip_tags(["script", "style"])
                 
                 # Get article content from #textoMateria
-                texto_materia = soup.select_one('#textoMateria')
+                texto_materia = tree.css_first('#textoMateria')
                 if texto_materia:
                     # Get title from #materia > h1 if available
-                    materia = soup.select_one('#materia')
-                    title = ''
-                    if materia:
-                        title_elem = materia.find('h1')
-                        if title_elem:
-                            title = title_elem.get_text(strip=True)
+                    title_elem = tree.css_first('#materia h1')
+                    title = node_text(title_elem) if title_elem else ''
                     
                     # Get content text
-                    content_text = texto_materia.get_text(separator='\n', strip=True)
+                    content_text = node_text(texto_materia, separator='\n')
                     
                     # Build HTML structure
                     body_content = f"<body><div class='senado-content'><h1>{title}</h1><div id='textoMateria'>{content_text}</div></div></body>"
@@ -293,42 +322,28 @@ def extract_full_article_content(url: str) -> Optional[str]:
                 logger.debug(f"Could not extract senado.leg.br content: {e}")
         
         # Standard extraction for other URLs
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        html = fetch_html(url, timeout=30)
+        if not html:
+            return None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = LexborHTMLParser(html)
         
         # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        tree.strip_tags(["script", "style"])
         
         # Try to find main article content
-        article_selectors = [
-            'article',
-            '.article-content',
-            '.article-body',
-            '.post-content',
-            '.entry-content',
-            'main',
-            '#content',
-            '.content',
-        ]
-        
         article_content = None
-        for selector in article_selectors:
-            content = soup.select_one(selector)
-            if content:
-                article_content = content
+        for selector in ARTICLE_SELECTORS:
+            article_content = tree.css_first(selector)
+            if article_content:
                 break
         
         if not article_content:
             # Fallback: use body
-            article_content = soup.find('body')
-            if not article_content:
-                article_content = soup
+            article_content = tree.body or tree.root
         
         # Extract text
-        text = article_content.get_text(separator='\n', strip=True)
+        text = node_text(article_content, separator='\n') if article_content else ''
         return text if text else None
         
     except Exception as e:
@@ -339,6 +354,61 @@ def extract_full_article_content(url: str) -> Optional[str]:
 # RSS FEED PROCESSING
 # -------------------------------------------------------------------------
 
+# Article downloads from every feed share one bounded pool
+ARTICLE_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+def save_legislation_article(feed_url: str, title: str, link: str, pub_date: str, description: str) -> int:
+    """Fetch, tag and store one legislation article (runs on ARTICLE_EXECUTOR); returns 1 if saved"""
+    try:
+        # Extract full article content
+        full_content = extract_full_article_content(link)
+        if not full_content:
+            logger.warning(f"Could not extract content from: {link}")
+            return 0
+        
+        # Tag the article (but DON'T filter by keywords)
+        combined_text = title + ' ' + description + ' ' + full_content
+        
+        # Tag the article for geographic/topical info
+        # (legislation articles bypass keyword filtering)
+        tags = {
+            'continents': detect_continents(combined_text),
+            'matched_keywords': [],  # No keyword matching for legislation
+            'core_topics': []  # No topic matching for legislation
+        }
+        
+        # Always add legislation tag
+        special_tags = ['legislation']
+        
+        # Enhanced tags with legislation
+        enhanced_tags = {
+            **tags,
+            'special_tags': special_tags
+        }
+        
+        # Save article (uses same folder structure as news_scraper)
+        # folder_prefix=None means it goes in same location as regular news
+        article_id = save_article(
+            title=title,
+            url=link,
+            pub_date=pub_date,
+            description=description,
+            full_content=full_content,
+            feed_url=feed_url,
+            tags=enhanced_tags,
+            source_type='Legislation Feed'
+        )
+        
+        if not article_id:
+            return 0
+        progress_tracker.mark_feed_complete(feed_url)  # Actually mark per article
+        add_processed_url(link)
+        logger.info(f"? Saved legislation article: {title[:50]}...")
+        return 1
+    except Exception as e:
+        logger.debug(f"Error processing RSS item {link}: {str(e)}")
+        return 0
+
 def process_single_legislation_feed(feed_url: str):
     """Process a single legislation RSS feed - NO KEYWORD FILTERING"""
     if progress_tracker.is_feed_complete(feed_url):
@@ -346,57 +416,26 @@ def process_single_legislation_feed(feed_url: str):
         return 0
         
     logger.info(f"Processing legislation RSS feed: {feed_url}")
-    feed_count = 0
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(feed_url, headers=headers, timeout=10)
+        response = http_get(feed_url, timeout=10)
         response.raise_for_status()
         
         # Parse RSS/Atom
-        soup = BeautifulSoup(response.content, 'xml')
-        items = soup.find_all('item')
-        if not items:
-            items = soup.find_all('entry')  # Atom feeds
+        items = parse_feed_items(response.content)
         
         logger.info(f"Found {len(items)} items in feed")
         
+        futures = []
+        seen_links = set()  # links already queued from this feed
         for item in items:
             try:
-                # Extract item data
-                title = item.find('title')
-                title = title.get_text() if title else 'No Title'
-                
-                # Handle link
-                link = None
-                if item.find('link'):
-                    link_elem = item.find('link')
-                    if link_elem.get('href'):
-                        link = link_elem.get('href')
-                    else:
-                        link = link_elem.get_text()
-                
-                # Handle date
-                pub_date = ''
-                if item.find('pubDate'):
-                    pub_date = item.find('pubDate').get_text()
-                elif item.find('published'):
-                    pub_date = item.find('published').get_text()
-                elif item.find('updated'):
-                    pub_date = item.find('updated').get_text()
+                title = item['title']
+                link = item['link']
+                pub_date = item['pub_date']
+                description = item['description']
                 
-                # Handle description
-                description = ''
-                if item.find('description'):
-                    description = item.find('description').get_text()
-                elif item.find('summary'):
-                    description = item.find('summary').get_text()
-                elif item.find('content'):
-                    description = item.find('content').get_text()
-                
-                if not link:
+                if not link or link in seen_links:
                     continue
                 
                 # Check if already processed
@@ -409,57 +448,17 @@ def process_single_legislation_feed(feed_url: str):
                     logger.debug(f"Filtering out old article: {title[:50]}... (date: {pub_date})")
                     continue
                 
-                # Extract full article content
-                full_content = extract_full_article_content(link)
-                if not full_content:
-                    logger.warning(f"Could not extract content from: {link}")
-                    continue
-                
-                # Tag the article (but DON'T filter by keywords)
-                combined_text = title + ' ' + description + ' ' + full_content
-                
-                # Tag the article for geographic/topical info
-                # (legislation articles bypass keyword filtering)
-                tags = {
-                    'continents': detect_continents(combined_text),
-                    'matched_keywords': [],  # No keyword matching for legislation
-                    'core_topics': []  # No topic matching for legislation
-                }
-                
-                # Always add legislation tag
-                special_tags = ['legislation']
-                
-                # Enhanced tags with legislation
-                enhanced_tags = {
-                    **tags,
-                    'special_tags': special_tags
-                }
-                
-                # Save article (uses same folder structure as news_scraper)
-                # folder_prefix=None means it goes in same location as regular news
-                article_id = save_article(
-                    title=title,
-                    url=link,
-                    pub_date=pub_date,
-                    description=description,
-                    full_content=full_content,
-                    feed_url=feed_url,
-                    tags=enhanced_tags,
-                    source_type='Legislation Feed'
-                )
-                
-                if article_id:
-                    feed_count += 1
-                    progress_tracker.mark_feed_complete(feed_url)  # Actually mark per article
-                    add_processed_url(link)
-                    logger.info(f"? Saved legislation article: {title[:50]}...")
-                
-                time.sleep(0.5)  # Rate limiting
+                # Fetch, tag and store the article on the shared article pool
+                seen_links.add(link)
+                futures.append(ARTICLE_EXECUTOR.submit(
+                    save_legislation_article, feed_url, title, link, pub_date, description
+                ))
                 
             except Exception as e:
                 logger.debug(f"Error processing RSS item: {str(e)}")
                 continue
         
+        feed_count = sum(future.result() for future in futures)
         progress_tracker.mark_feed_complete(feed_url)
         logger.info(f"Completed feed: {feed_url} ({feed_count} articles)")
         return feed_count
@@ -503,6 +502,8 @@ def process_legislation_feeds():
         results = list(executor.map(process_single_legislation_feed, feeds_to_process))
     
     total_processed = sum(results)
+    progress_tracker.flush()
+    flush_daily_manifest()
     logger.info(f"=== LEGISLATION SCRAPER: Complete ({total_processed} total articles) ===")
     logger.info(f"? All legislation articles saved to s3://{S3_BUCKET_NAME}/{get_today_folder()}/")
 
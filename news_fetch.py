@@ -0,0 +1,245 @@
+"""
+Shared Fetching Utilities for News Collection System
+
+This module provides the HTTP plumbing shared by the scrapers: pooled,
+retrying per-thread sessions, per-host politeness limits, small HTML
+helpers and RSS/Atom feed parsing. Used by news_scraper.py, legislation_scraper.py and
+utils/historical_legislation_scraper.py.
+"""
+
+import re
+import codecs
+import atexit
+import threading
+from contextlib import contextmanager
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger("news_fetch")
+
+# -------------------------------------------------------------------------
+# SESSIONS
+# -------------------------------------------------------------------------
+# One pooled keep-alive session per worker thread, so repeat requests to the
+# same hosts skip the TCP/TLS handshake
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+# Transient failures are retried inside the adapter with exponential backoff,
+# waiting as long as a 429/503's Retry-After asks
+HTTP_RETRY = Retry(total=3, backoff_factor=0.3,
+                   status_forcelist=[429, 500, 502, 503, 504],
+                   respect_retry_after_header=True)
+_http_local = threading.local()
+_http_sessions = []
+_http_sessions_lock = threading.Lock()
+
+def get_http_session(session_factory: Callable[[], requests.Session] = requests.Session) -> requests.Session:
+    """
+    Return this thread's session built by session_factory, creating it on first use.
+
+    Every session gets the shared pooled, retrying adapter and User-Agent;
+    session_factory only chooses the session class (news_scraper passes one
+    that builds a caching session).
+    """
+    sessions = getattr(_http_local, 'sessions', None)
+    if sessions is None:
+        sessions = _http_local.sessions = {}
+    session = sessions.get(session_factory)
+    if session is None:
+        session = session_factory()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=HTTP_RETRY
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'User-Agent': USER_AGENT})
+        sessions[session_factory] = session
+        with _http_sessions_lock:
+            _http_sessions.append(session)
+    return session
+
+@atexit.register
+def close_http_sessions():
+    """Close every thread's sessions at interpreter exit"""
+    with _http_sessions_lock:
+        for session in _http_sessions:
+            session.close()
+
+# -------------------------------------------------------------------------
+# POLITENESS
+# -------------------------------------------------------------------------
+# At most this many requests in flight to any one host, across every scraper
+# in the process; different hosts proceed in parallel
+HOST_MAX_CONCURRENCY = 2
+_host_semaphores = defaultdict(lambda: threading.Semaphore(HOST_MAX_CONCURRENCY))
+_host_semaphores_lock = threading.Lock()
+
+@lru_cache(maxsize=4096)
+def url_host(url: str) -> str:
+    """Lowercased host of url without a leading 'www.'"""
+    return urlparse(url).netloc.lower().removeprefix('www.')
+
+def host_semaphore(url: str) -> threading.Semaphore:
+    """Return the concurrency limiter for url's host"""
+    with _host_semaphores_lock:
+        return _host_semaphores[url_host(url)]
+
+def http_get(url: str, session_factory: Callable[[], requests.Session] = requests.Session,
+             **kwargs) -> requests.Response:
+    """GET url on this thread's session, holding its host's semaphore"""
+    with host_semaphore(url):
+        return get_http_session(session_factory).get(url, **kwargs)
+
+@contextmanager
+def http_stream(url: str, session_factory: Callable[[], requests.Session] = requests.Session,
+                **kwargs) -> Iterator[requests.Response]:
+    """
+    Streamed GET of url on this thread's session.
+
+    The host's semaphore is held until the with-block exits and the response
+    is closed, so the body download counts against the per-host limit too
+    (http_get releases it as soon as the headers arrive).
+    """
+    with host_semaphore(url):
+        response = get_http_session(session_factory).get(url, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            response.close()
+
+# -------------------------------------------------------------------------
+# HTML HELPERS
+# -------------------------------------------------------------------------
+def node_text(node, separator: str = '') -> str:
+    """Stripped, non-empty text of a selectolax node, like BeautifulSoup's get_text(separator, strip=True)"""
+    parts = (child.text_content.strip() for child in node.traverse(include_text=True) if child.tag == '-text')
+    return separator.join(part for part in parts if part)
+
+# charset=... parameter of a Content-Type header
+CONTENT_TYPE_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">
+META_CHARSET_RE = re.compile(rb'<meta[^>]*?charset\s*=\s*["\']?([\w.:-]+)', re.I)
+
+def known_charset(name: Optional[str]) -> Optional[str]:
+    """name if Python has a codec for it, else None"""
+    if not name:
+        return None
+    try:
+        codecs.lookup(name)
+        return name
+    except LookupError:
+        return None
+
+def declared_charset(response: requests.Response) -> Optional[str]:
+    """Charset declared in the Content-Type header, or None"""
+    # Not response.encoding: requests reports ISO-8859-1 for any text/*
+    # response without a charset, which would hide an undeclared UTF-8 page
+    match = CONTENT_TYPE_CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    return known_charset(match.group(1)) if match else None
+
+def html_encoding(response: requests.Response, head: bytes) -> Optional[str]:
+    """
+    Encoding of an HTML response whose body starts with head.
+
+    Tries the Content-Type charset, then a <meta> charset in head, then UTF-8
+    if head decodes as UTF-8 (as BeautifulSoup did). None if none applies, in
+    which case the parser's own default is used.
+    """
+    charset = declared_charset(response)
+    if charset:
+        return charset
+    match = META_CHARSET_RE.search(head)
+    charset = known_charset(match.group(1).decode('ascii')) if match else None
+    if charset:
+        return charset
+    try:
+        # Not final: head may end part-way through a multi-byte character
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return None
+
+def decode_html(response: requests.Response, body: bytes) -> str:
+    """Decode an HTML body (from response) to str for parsers that take text, like selectolax"""
+    # windows-1252 is what browsers (and BeautifulSoup) fall back to
+    return body.decode(html_encoding(response, body) or 'windows-1252', 'replace')
+
+# Pages are parsed from at most this many bytes (article text comes well before
+# trailing embeds and scripts); longer pages are truncated, not skipped
+HTML_MAX_BYTES = 2 * 1024 * 1024
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml')
+
+def is_html_content_type(content_type: str) -> bool:
+    """True for an HTML Content-Type, or none at all"""
+    return not content_type or any(kind in content_type for kind in HTML_CONTENT_TYPES)
+
+def fetch_html(url: str, session_factory: Callable[[], requests.Session] = requests.Session,
+               **kwargs) -> Optional[str]:
+    """GET an HTML page, reading and decoding at most HTML_MAX_BYTES of it; None if it isn't HTML"""
+    with http_stream(url, session_factory=session_factory, **kwargs) as response:
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type', '')
+        if not is_html_content_type(content_type):
+            logger.debug(f"Skipping non-HTML response ({content_type}): {url}")
+            return None
+        # selectolax ignores <meta charset> in bytes input, so decode here
+        return decode_html(response, response.raw.read(HTML_MAX_BYTES, decode_content=True))
+
+# -------------------------------------------------------------------------
+# FEED PARSING
+# -------------------------------------------------------------------------
+def feed_field_text(element) -> str:
+    """All text inside a feed element (CDATA included), like BeautifulSoup's get_text"""
+    return ''.join(element.itertext()) if element is not None else ''
+
+def parse_feed_items(content: bytes) -> List[Dict]:
+    """
+    Parse an RSS or Atom document into title/link/pub_date/description dicts.
+    
+    Elements are matched by local name so RSS 1.0/2.0 and Atom namespaces all
+    work, and the recovering parser tolerates the malformed feeds some sites serve.
+    """
+    parser = etree.XMLParser(recover=True, huge_tree=True, resolve_entities=False)
+    try:
+        root = etree.fromstring(content, parser=parser)
+    except etree.XMLSyntaxError:
+        return []
+    if root is None:
+        return []
+    
+    items = []
+    elements = list(root.iter('{*}item')) or list(root.iter('{*}entry'))  # RSS, then Atom
+    for element in elements:
+        # First child element of each name
+        fields = {}
+        for child in element:
+            if isinstance(child.tag, str):
+                fields.setdefault(etree.QName(child).localname, child)
+        
+        # Handle different link formats (RSS vs Atom)
+        link = None
+        link_elem = fields.get('link')
+        if link_elem is not None:
+            link = link_elem.get('href') or feed_field_text(link_elem)  # Atom, then RSS
+        
+        # Handle different date and description formats (RSS, then Atom)
+        date_elem = next((fields[name] for name in ('pubDate', 'published', 'updated') if name in fields), None)
+        description_elem = next((fields[name] for name in ('description', 'summary', 'content') if name in fields), None)
+        
+        items.append({
+            'title': feed_field_text(fields['title']) if 'title' in fields else 'No Title',
+            'link': link,
+            'pub_date': feed_field_text(date_elem),
+            'description': feed_field_text(description_elem)
+        })
+    return items
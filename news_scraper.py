@@ -7,23 +7,44 @@ Features: Master index for browsing all collected dates
 """
 
 import os
+import io
 import re
-import json
+import gzip
 import time
-import boto3
+import orjson
+import pickle
+import itertools
+import ahocorasick
 import logging
 import requests
+import requests_cache
 import hashlib
 import sys
 import argparse
-from datetime import datetime, date
+import threading
+from datetime import datetime, date, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from html import unescape as html_unescape
+from dateutil import parser as date_parser
 from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse, quote
-from bs4 import BeautifulSoup
+import jinja2
+import lxml.html
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
+from botocore.exceptions import ClientError
 from concurrent.futures import ThreadPoolExecutor
+from pybloom_live import ScalableBloomFilter
 
 # Import the article tagging module
 from article_tagger import tag_article
+from news_storage import record_manifest_entry, flush_daily_manifest, load_daily_manifest, url_hash, legacy_url_hash
+# One S3 client for the whole process (see news_storage)
+from news_storage import s3_client, S3_MAX_POOL_CONNECTIONS, put_object_if_absent, upload_article_content
+import news_fetch
+from news_fetch import get_http_session, host_semaphore, html_encoding, parse_feed_items
+from news_fetch import HTML_MAX_BYTES, is_html_content_type
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("news_scraper")
@@ -51,6 +72,9 @@ S3_FOLDER_NEWS = f"news/{today}"
 
 # Track progress - use /tmp in Lambda environment
 PROGRESS_FILE = "/tmp/news_scraper_progress.json" if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') else "news_scraper_progress.json"
+# Feed ETag/Last-Modified validators live in their own file so they survive
+# the fresh-mode progress reset
+FEED_VALIDATORS_FILE = "/tmp/news_feed_validators.json" if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') else "news_feed_validators.json"
 
 # Search keywords - comprehensive energy, AI, blockchain, and finance terms
 NEWS_KEYWORDS = [
@@ -68,7 +92,7 @@ NEWS_KEYWORDS = [
     
     # Insurance/Risk
     "catastrophe modeling", "exposure data", "reinsurance", "underwriting", 
-    "climate risk", "war","civil unrest","protest","climate risk",
+    "climate risk", "war","civil unrest","protest",
     
     # Technology
     "cybersecurity", "digital twin", "predictive analytics",
@@ -279,21 +303,95 @@ NEWS_SOURCES = {
     ]
 }
 
-s3_client = boto3.client("s3", region_name="us-east-1")
+# Listing options shared by every list_objects_v2 paginator: full 1,000-key
+# pages and no owner lookups (only keys and timestamps are used)
+S3_LIST_ARGS = dict(FetchOwner=False, PaginationConfig={'PageSize': 1000})
+S3_LIST_PAGINATOR = s3_client.get_paginator('list_objects_v2')
+
+# HTTP: sessions, retries and per-host limits come from news_fetch. Responses
+# are cached on disk (honouring Cache-Control) so repeat fetches of an article
+# across runs are served locally. With brotli installed (see requirements),
+# requests also advertises and decodes br, which usually beats gzip on HTML.
+HTTP_CONNECT_TIMEOUT = 5  # seconds
+HTTP_CACHE_FILE = "/tmp/news_http_cache.sqlite" if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') else "news_http_cache.sqlite"
+HTTP_CACHE_EXPIRE_AFTER = 24 * 60 * 60  # seconds
+_http_cache = None
+_http_cache_lock = threading.Lock()
+
+def get_http_cache() -> requests_cache.SQLiteCache:
+    """Return the SQLite response cache shared by all threads' sessions"""
+    global _http_cache
+    with _http_cache_lock:
+        if _http_cache is None:
+            _http_cache = requests_cache.SQLiteCache(HTTP_CACHE_FILE, wal=True)
+        return _http_cache
+
+def prune_http_cache():
+    """Drop expired responses so the cache file does not grow run after run"""
+    if _http_cache is None:
+        return  # nothing was fetched through the cache this run
+    try:
+        _http_cache.delete(expired=True)
+    except Exception as e:
+        logger.debug(f"Failed to prune HTTP cache: {e}")
+
+def is_cacheable_response(response: requests.Response) -> bool:
+    """
+    Cache only HTML responses that declare a Content-Length within HTML_MAX_BYTES.
+
+    Saving a response makes requests-cache read its whole body up front, so a
+    large page or a PDF would be downloaded in full even though fetch_html_tree
+    stops reading at HTML_MAX_BYTES or skips it. Responses without a length
+    (chunked) are streamed uncached for the same reason.
+    """
+    if not is_html_content_type(response.headers.get('Content-Type', '')):
+        return False
+    length = response.headers.get('Content-Length', '')
+    return length.isdigit() and int(length) <= HTML_MAX_BYTES
+
+def new_cached_session() -> requests_cache.CachedSession:
+    """Build a session backed by the shared response cache (see news_fetch.get_http_session)"""
+    return requests_cache.CachedSession(
+        backend=get_http_cache(),
+        expire_after=HTTP_CACHE_EXPIRE_AFTER,
+        cache_control=True,
+        allowable_methods=('GET', 'HEAD'),
+        filter_fn=is_cacheable_response,
+        autoclose=False  # the backend outlives any one thread's session
+    )
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET url on this thread's cached session, holding its host's semaphore"""
+    return news_fetch.http_get(url, session_factory=new_cached_session, **kwargs)
+
+def http_stream(url: str, **kwargs):
+    """Streamed GET of url on this thread's cached session (see news_fetch.http_stream)"""
+    return news_fetch.http_stream(url, session_factory=new_cached_session, **kwargs)
 
 # -------------------------------------------------------------------------
 # PROGRESS TRACKING
 # -------------------------------------------------------------------------
+# Progress writes are batched so a busy run rewrites the file at most once a second
+PROGRESS_FLUSH_INTERVAL = 1.0
+
 class ProgressTracker:
-    def __init__(self, progress_file=PROGRESS_FILE):
+    def __init__(self, progress_file=PROGRESS_FILE, validators_file=FEED_VALIDATORS_FILE):
         self.progress_file = progress_file
         self.progress = self.load_progress()
+        self.validators_file = validators_file
+        self.feed_validators = self.load_feed_validators()
+        # Feeds are processed on a thread pool, so updates and file writes are serialized
+        self.lock = threading.RLock()
+        # Writes are debounced: mutators mark the tracker dirty and a timer
+        # flushes to disk at most once per PROGRESS_FLUSH_INTERVAL
+        self._dirty = False
+        self._flush_timer = None
     
     def load_progress(self):
         """Load progress from file or initialize new"""
         if os.path.exists(self.progress_file):
-            with open(self.progress_file, 'r') as f:
-                return json.load(f)
+            with open(self.progress_file, 'rb') as f:
+                return orjson.loads(f.read())
         return {
             "rss_feeds": {"feeds_completed": []},
             "direct_scraping": {"sources_completed": []},
@@ -301,17 +399,49 @@ class ProgressTracker:
             "last_updated": None
         }
     
+    def load_feed_validators(self):
+        """Load saved feed validators, or start with none"""
+        if os.path.exists(self.validators_file):
+            with open(self.validators_file, 'rb') as f:
+                return orjson.loads(f.read())
+        return {}
+    
     def save_progress(self):
-        """Save current progress"""
-        self.progress["last_updated"] = datetime.now().isoformat()
-        with open(self.progress_file, 'w') as f:
-            json.dump(self.progress, f, indent=2)
+        """Schedule a write of the current progress"""
+        with self.lock:
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(PROGRESS_FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush(self):
+        """Write progress to disk if anything changed since the last write"""
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self.progress["last_updated"] = datetime.now().isoformat()
+            self._write_json(self.progress_file, self.progress)
+            self._write_json(self.validators_file, self.feed_validators)
+            self._dirty = False
+    
+    @staticmethod
+    def _write_json(path, data):
+        # Write-then-rename so a crash mid-write never leaves a truncated file
+        tmp_file = path + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, path)
     
     def mark_feed_complete(self, feed_url):
         """Mark a feed as completed"""
-        if feed_url not in self.progress["rss_feeds"]["feeds_completed"]:
-            self.progress["rss_feeds"]["feeds_completed"].append(feed_url)
-            self.save_progress()
+        with self.lock:
+            if feed_url not in self.progress["rss_feeds"]["feeds_completed"]:
+                self.progress["rss_feeds"]["feeds_completed"].append(feed_url)
+                self.save_progress()
     
     def is_feed_complete(self, feed_url):
         """Check if feed was already processed"""
@@ -319,11 +449,27 @@ class ProgressTracker:
             return False
         return feed_url in self.progress["rss_feeds"].get("feeds_completed", [])
     
+    def get_feed_validators(self, feed_url):
+        """Return the ETag/Last-Modified saved for a feed by an earlier poll"""
+        if FRESH_MODE:
+            # Fresh runs reparse every feed, but still record new validators
+            return {}
+        return self.feed_validators.get(feed_url, {})
+    
+    def set_feed_validators(self, feed_url, etag, modified):
+        """Remember a feed's ETag/Last-Modified for a conditional GET on the next poll"""
+        if not etag and not modified:
+            return
+        with self.lock:
+            self.feed_validators[feed_url] = {"etag": etag, "modified": modified}
+            self.save_progress()
+    
     def mark_source_complete(self, source_url):
         """Mark a source as completed"""
-        if source_url not in self.progress["direct_scraping"]["sources_completed"]:
-            self.progress["direct_scraping"]["sources_completed"].append(source_url)
-            self.save_progress()
+        with self.lock:
+            if source_url not in self.progress["direct_scraping"]["sources_completed"]:
+                self.progress["direct_scraping"]["sources_completed"].append(source_url)
+                self.save_progress()
     
     def is_source_complete(self, source_url):
         """Check if source was already processed"""
@@ -333,49 +479,123 @@ class ProgressTracker:
     
     def increment_articles(self, count=1):
         """Increment total article count"""
-        self.progress["total_articles"] += count
-        self.save_progress()
+        with self.lock:
+            self.progress["total_articles"] += count
+            self.save_progress()
 
 progress_tracker = ProgressTracker()
 
 # -------------------------------------------------------------------------
 # IDEMPOTENT S3 OPERATIONS
 # -------------------------------------------------------------------------
+# Articles stored within the last PROCESSED_LOOKBACK_DAYS date folders (today
+# included) are not collected again, so a story that stays in a feed for days
+# is saved once. Each date's hashes live in their own Bloom filter, so memory
+# stays bounded and dates leaving the window are simply dropped. A false
+# positive (~1 in 10,000) only means one article is skipped; exists_in_s3
+# still uses the exact manifest of today's keys.
+PROCESSED_LOOKBACK_DAYS = 7
+PROCESSED_FILTER_CAPACITY = 10_000  # per date; the filters grow past this
+PROCESSED_FILTER_ERROR_RATE = 1e-4
+_processed_filter_lock = threading.Lock()
+
+def new_processed_filter() -> ScalableBloomFilter:
+    """Create an empty processed-article filter"""
+    return ScalableBloomFilter(initial_capacity=PROCESSED_FILTER_CAPACITY,
+                               error_rate=PROCESSED_FILTER_ERROR_RATE)
+
+def lookback_dates() -> List[str]:
+    """Date folders whose articles count as processed, newest (today) first"""
+    start = date.fromisoformat(today)
+    return [(start - timedelta(days=days)).isoformat() for days in range(PROCESSED_LOOKBACK_DAYS)]
+
+class ProcessedHashes:
+    """Processed-article hashes for the look-back window, one Bloom filter per date"""
+    def __init__(self, filters: Dict[str, ScalableBloomFilter]):
+        self.filters = filters
+        self.filters.setdefault(today, new_processed_filter())
+    
+    def __contains__(self, article_hash: str) -> bool:
+        return any(article_hash in hashes for hashes in self.filters.values())
+    
+    def __len__(self) -> int:
+        return sum(len(hashes) for hashes in self.filters.values())
+    
+    def add(self, article_hash: str):
+        """Record an article stored today"""
+        self.filters[today].add(article_hash)
+
+# Earlier dates' filters are cached on disk between runs, since their folders
+# no longer change; today's folder is always listed again. Cached dates outside
+# the window are dropped on load, and a cache in any other format is ignored.
+S3_MANIFEST_CACHE_FILE = "/tmp/s3_manifest_cache.pkl" if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') else ".s3_manifest_cache.pkl"
+
+def load_manifest_cache() -> Dict[str, ScalableBloomFilter]:
+    """Return the cached per-date filters still inside the look-back window"""
+    try:
+        with open(S3_MANIFEST_CACHE_FILE, 'rb') as f:
+            cache = pickle.load(f)
+        window = set(lookback_dates())
+        return {date_str: hashes for date_str, hashes in cache['dates'].items() if date_str in window}
+    except Exception as e:
+        logger.debug(f"No S3 manifest cache loaded: {e}")
+        return {}
+
+def save_manifest_cache(filters: Dict[str, ScalableBloomFilter]):
+    """Persist the filters of dates before today for the next run"""
+    try:
+        with open(S3_MANIFEST_CACHE_FILE, 'wb') as f:
+            pickle.dump({'dates': {date_str: hashes for date_str, hashes in filters.items()
+                                   if date_str != today}}, f)
+    except Exception as e:
+        logger.debug(f"Failed to save S3 manifest cache: {e}")
+
+def list_date_folder(date_str: str, manifest: Optional[set] = None) -> ScalableBloomFilter:
+    """Hashes of the articles stored under news/<date_str>/, adding every key to manifest if given"""
+    hashes = new_processed_filter()
+    page_iterator = S3_LIST_PAGINATOR.paginate(Bucket=S3_BUCKET_NAME, Prefix=f"news/{date_str}/", **S3_LIST_ARGS)
+    for page in page_iterator:
+        for obj in page.get('Contents', []):
+            key = obj['Key']
+            if manifest is not None:
+                manifest.add(key)
+            # The metadata file name is the article's URL hash
+            if key.endswith('.json') and '/metadata/' in key:
+                hashes.add(key.rsplit('/', 1)[-1][:-len('.json')])
+    return hashes
+
 def get_s3_manifest():
-    """Get manifest of all files already in S3 bucket/prefix"""
+    """
+    Get manifest of today's files in S3 plus the hashes of the articles stored
+    in the look-back window.
+    
+    Metadata files are named <url_hash(url)>.json, so the processed-URL set is built
+    from key names without downloading any metadata. Only today's folder and
+    window dates missing from the disk cache are listed.
+    """
     manifest = set()
-    article_urls = set()  # Track URLs we've already processed
+    cached = load_manifest_cache()
+    filters = {}
     
     try:
-        paginator = s3_client.get_paginator('list_objects_v2')
-        page_iterator = paginator.paginate(
-            Bucket=S3_BUCKET_NAME,
-            Prefix=S3_FOLDER_NEWS + "/"
-        )
+        for date_str in lookback_dates():
+            if date_str == today:
+                filters[date_str] = list_date_folder(date_str, manifest)
+            elif date_str in cached:
+                filters[date_str] = cached[date_str]
+            else:
+                filters[date_str] = list_date_folder(date_str)
         
-        for page in page_iterator:
-            if 'Contents' in page:
-                for obj in page['Contents']:
-                    manifest.add(obj['Key'])
-                    
-                    # Extract URLs from metadata files for URL-based deduplication
-                    if obj['Key'].endswith('.json') and '/metadata/' in obj['Key']:
-                        try:
-                            response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=obj['Key'])
-                            metadata = json.loads(response['Body'].read().decode('utf-8'))
-                            if 'url' in metadata:
-                                article_urls.add(metadata['url'])
-                        except Exception as e:
-                            logger.debug(f"Could not extract URL from {obj['Key']}: {e}")
-        
-        logger.info(f"S3 manifest loaded: {len(manifest)} existing files, {len(article_urls)} unique article URLs")
-        return manifest, article_urls
+        save_manifest_cache(filters)
+        processed = ProcessedHashes(filters)
+        logger.info(f"S3 manifest loaded: {len(manifest)} existing files today, {len(processed)} processed articles")
+        return manifest, processed
     except Exception as e:
         logger.error(f"Error loading S3 manifest: {str(e)}")
-        return set(), set()
+        return set(), ProcessedHashes({**cached, **filters})
 
 # Global manifest for idempotency
-S3_MANIFEST, S3_PROCESSED_URLS = get_s3_manifest()
+S3_MANIFEST, S3_PROCESSED_HASHES = get_s3_manifest()
 
 def exists_in_s3(key: str) -> bool:
     """Check if file exists in S3 using manifest"""
@@ -383,41 +603,67 @@ def exists_in_s3(key: str) -> bool:
         return False
     return key in S3_MANIFEST
 
+# SimHashes of today's stored article bodies, for near-duplicate detection
+# (wire stories reprinted by several outlets under different URLs). Fresh runs
+# rewrite today's articles, so they start empty.
+SIMHASH_MAX_DISTANCE = 3  # differing bits out of 64
+S3_CONTENT_SIMHASHES = [] if FRESH_MODE else [
+    int(entry['simhash'], 16) for entry in load_daily_manifest(today).values() if 'simhash' in entry
+]
+_content_simhash_lock = threading.Lock()
+
 def url_already_processed(url: str) -> bool:
     """Check if URL was already processed (idempotency across runs)"""
     if FRESH_MODE:
         return False
-    return url in S3_PROCESSED_URLS
+    return url_hash(url) in S3_PROCESSED_HASHES or legacy_url_hash(url) in S3_PROCESSED_HASHES
 
 def add_processed_url(url: str):
     """Add URL to processed set"""
-    S3_PROCESSED_URLS.add(url)
+    # The filter grows by adding slices, which is not thread-safe
+    with _processed_filter_lock:
+        S3_PROCESSED_HASHES.add(url_hash(url))
+
+# ASCII characters outside [\w.-] map to '_' in one str.translate pass
+FILENAME_UNSAFE_TABLE = str.maketrans({
+    chr(code): '_' for code in range(128)
+    if not (chr(code).isalnum() or chr(code) in '_.-')
+})
 
 def sanitize_filename(key: str) -> str:
-    parts = key.split("/")
-    filename = parts[-1].strip()
-    filename = filename.replace("\\", "_")
-    filename = re.sub(r"\s+", "_", filename)
-    filename = re.sub(r"[^\w\.-]", "_", filename)
-    parts[-1] = filename
-    return "/".join(parts)
+    folder, sep, filename = key.rpartition("/")
+    filename = filename.strip()
+    if filename.isascii():
+        # Whitespace runs collapse to a single '_' like the regex path below
+        filename = '_'.join(filename.split()).translate(FILENAME_UNSAFE_TABLE)
+    else:
+        filename = re.sub(r"\s+", "_", filename)
+        filename = re.sub(r"[^\w\.-]", "_", filename)
+    return folder + sep + filename
 
 def upload_to_s3_if_not_exists(file_content: bytes, s3_key: str, content_type: str = "text/html"):
     s3_key = sanitize_filename(s3_key)
     
-    # Check manifest first (faster than HEAD request)
+    # Check manifest first (no request needed)
     if exists_in_s3(s3_key):
         logger.debug(f"Skipping (exists in manifest): {s3_key}")
         return False
     
     try:
         logger.info(f"Uploading to S3: {s3_key}")
-        s3_client.put_object(
+        put_kwargs = dict(
             Bucket=S3_BUCKET_NAME,
             Key=s3_key,
             Body=file_content,
             ContentType=content_type
         )
+        if FRESH_MODE:
+            # Fresh mode overwrites existing objects
+            s3_client.put_object(**put_kwargs)
+        elif not put_object_if_absent(**put_kwargs):
+            S3_MANIFEST.add(s3_key)
+            logger.debug(f"Skipping (exists in S3): {s3_key}")
+            return False
         # Add to manifest
         S3_MANIFEST.add(s3_key)
         logger.info(f"? Uploaded: {s3_key}")
@@ -426,26 +672,62 @@ def upload_to_s3_if_not_exists(file_content: bytes, s3_key: str, content_type: s
         logger.error(f"Failed to upload {s3_key}: {e}")
         return False
 
+def upload_article_to_s3(metadata: Dict, metadata_key: str, full_content: str, content_key: str) -> bool:
+    """
+    Upload an article's content HTML, then its metadata JSON.
+    
+    The metadata object is what marks an article as processed (later runs skip
+    its URL), so it is only written once the content is stored. The content
+    PUT is unconditional, so an article whose metadata upload failed is
+    completed by the next run. Returns True only if the metadata was newly written.
+    """
+    if not upload_article_content(full_content, sanitize_filename(content_key)):
+        return False
+    
+    return upload_to_s3_if_not_exists(
+        orjson.dumps(metadata, option=orjson.OPT_INDENT_2),
+        metadata_key,
+        "application/json"
+    )
+
+def s3_body_unchanged(s3_key: str, body: bytes, etag: Optional[str] = None) -> bool:
+    """
+    Check whether the object at s3_key already holds exactly this body.
+    
+    Compares the MD5 of body with the object's ETag (which is the MD5 for
+    single-part uploads). Pass etag if it is already known from a GET to
+    skip the HEAD request.
+    """
+    if etag is None:
+        try:
+            etag = s3_client.head_object(Bucket=S3_BUCKET_NAME, Key=s3_key)['ETag']
+        except ClientError:
+            return False
+    return etag.strip('"') == hashlib.md5(body).hexdigest()
+
 # -------------------------------------------------------------------------
 # NEWS EXTRACTION UTILITIES
 # -------------------------------------------------------------------------
+# Links on archive.today search pages that point at a stored snapshot
+ARCHIVE_LINK_RE = re.compile(r'archive\.today|archive\.is')
+# Every anchor href on a page (compiled once, shared by archive and listing scans)
+ANCHOR_HREFS_XPATH = etree.XPath('//a/@href')
+
 def try_archive_fallback(url: str) -> Optional[str]:
     """Try to get article content from archive.is"""
     try:
         # Try to find existing archive
         archive_search_url = f"https://archive.today/newest/{url}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(archive_search_url, headers=headers, timeout=30)
+        # Archived snapshots do not change, so keep them indefinitely
+        response = http_get(archive_search_url, expire_after=requests_cache.NEVER_EXPIRE,
+                            timeout=(HTTP_CONNECT_TIMEOUT, 30))
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            root = lxml.html.fromstring(response.content)
             
             # Look for archived version link
-            archive_links = soup.find_all('a', href=re.compile(r'archive\.today|archive\.is'))
+            archive_links = [href for href in ANCHOR_HREFS_XPATH(root) if ARCHIVE_LINK_RE.search(href)]
             if archive_links:
-                archive_url = archive_links[0]['href']
+                archive_url = archive_links[0]
                 if not archive_url.startswith('http'):
                     archive_url = 'https://archive.today' + archive_url
                 
@@ -457,7 +739,8 @@ def try_archive_fallback(url: str) -> Optional[str]:
         archive_create_url = "https://archive.today/submit/"
         data = {'url': url}
         
-        response = requests.post(archive_create_url, data=data, headers=headers, timeout=60)
+        with host_semaphore(archive_create_url):
+            response = get_http_session(new_cached_session).post(archive_create_url, data=data, timeout=(HTTP_CONNECT_TIMEOUT, 60))
         if response.status_code == 200:
             # Archive creation initiated, but we won't wait for completion
             logger.info(f"Archive creation initiated for: {url}")
@@ -468,66 +751,146 @@ def try_archive_fallback(url: str) -> Optional[str]:
         logger.debug(f"Archive.is fallback failed for {url}: {str(e)}")
         return None
 
+@lru_cache(maxsize=8192)
+def parse_article_date(article_date_str: str) -> Optional[datetime]:
+    """Parse an RSS (RFC 822), Atom (ISO 8601) or free-form article date; None if unparseable.
+    
+    The same feed dates are parsed again by the date index sort and render
+    loops, so results are memoised; dateutil is only tried last.
+    """
+    article_date_str = article_date_str.strip()
+    if not article_date_str:
+        return None
+    try:
+        return parsedate_to_datetime(article_date_str)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(article_date_str)
+    except ValueError:
+        pass
+    try:
+        return date_parser.parse(article_date_str)
+    except (ValueError, OverflowError):
+        return None
+
 def is_2025_article(article_date_str: str) -> bool:
-    """Check if article is from 2025 or recent (since we might not have exact dates)"""
+    """Check if article is from 2025 or later; items whose date cannot be read are excluded"""
     if not article_date_str:
-        # If no date, assume it's recent and include it
-        return True
-    
-    # Try to extract year from date string
-    year_match = re.search(r'202[5-9]', article_date_str)
-    if year_match:
-        year = int(year_match.group())
-        return year >= 2025
-    
-    # Look for 2025 indicators in various formats
-    if '2025' in article_date_str:
-        return True
+        return False
     
-    # If we can't determine the year, assume it's recent and include it
-    return True
+    article_date = parse_article_date(article_date_str)
+    if article_date is None:
+        logger.debug(f"Unparseable article date: {article_date_str}")
+        return False
+    return article_date.year >= 2025
 
-def extract_full_article_content(url: str) -> Optional[str]:
-    """Extract full article content from URL with archive.is fallback"""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30)
+def class_predicate(class_name: str) -> str:
+    """XPath predicate that is true for elements carrying class_name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+def class_xpath(class_name: str) -> str:
+    """XPath equivalent of the CSS selector .class_name"""
+    return f"//*[{class_predicate(class_name)}]"
+
+def element_text(element, strip: bool = False) -> str:
+    """Text content of an lxml element, like BeautifulSoup's get_text(strip=...)"""
+    if strip:
+        return ''.join(text.strip() for text in element.itertext())
+    return ''.join(element.itertext())
+
+HTML_CHUNK_SIZE = 64 * 1024
+
+def fetch_html_tree(url: str, read_timeout: int = 30):
+    """
+    GET url and parse the body with lxml as it streams in.
+
+    Only small HTML pages are read in full up front, by the response cache
+    (see is_cacheable_response); anything else is streamed and read no
+    further than HTML_MAX_BYTES.
+    """
+    with http_stream(url, timeout=(HTTP_CONNECT_TIMEOUT, read_timeout)) as response:
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        content_type = response.headers.get('Content-Type', '')
+        if not is_html_content_type(content_type):
+            logger.debug(f"Skipping non-HTML response ({content_type}): {url}")
+            return None
+        
+        # The parser needs the encoding up front: without one libxml2 falls
+        # back to Latin-1 for pages with no <meta charset>
+        chunks = response.iter_content(HTML_CHUNK_SIZE)
+        first_chunk = next(chunks, b'')
+        try:
+            parser = lxml.html.HTMLParser(encoding=html_encoding(response, first_chunk))
+        except LookupError:
+            parser = lxml.html.HTMLParser()  # a charset libxml2 has no converter for
+        received = 0
+        for chunk in itertools.chain((first_chunk,), chunks):
+            parser.feed(chunk)
+            received += len(chunk)
+            if received >= HTML_MAX_BYTES:
+                break
+        try:
+            return parser.close()
+        except etree.XMLSyntaxError:
+            return None  # empty body
+
+# Article body containers, most specific first (XPath predicates for the CSS
+# selectors article, [data-module="ArticleBody"], .article-body, ...)
+ARTICLE_CONTENT_PREDICATES = [
+    'self::article',
+    '@data-module="ArticleBody"',
+    class_predicate('article-body'),
+    class_predicate('story-body'),
+    class_predicate('post-content'),
+    class_predicate('entry-content'),
+    class_predicate('content'),
+    'self::main',
+    class_predicate('article-content')
+]
+# All candidate containers in one tree walk; each candidate is then ranked by
+# testing the predicates against that element alone
+ARTICLE_CONTENT_XPATH = etree.XPath('//*[' + ' or '.join(f'({p})' for p in ARTICLE_CONTENT_PREDICATES) + ']')
+ARTICLE_CONTENT_TESTS = [etree.XPath(f'boolean({p})') for p in ARTICLE_CONTENT_PREDICATES]
+
+def find_article_containers(root) -> List:
+    """First element (in document order) matching each content predicate, in priority order"""
+    first_matches = [None] * len(ARTICLE_CONTENT_TESTS)
+    for element in ARTICLE_CONTENT_XPATH(root):
+        for priority, test in enumerate(ARTICLE_CONTENT_TESTS):
+            if first_matches[priority] is None and test(element):
+                first_matches[priority] = element
+    return [element for element in first_matches if element is not None]
+
+def extract_full_article_content(url: str, root=None) -> Optional[str]:
+    """
+    Extract full article content from URL with archive.is fallback.
+    
+    Pass root when the page has already been fetched and parsed (it is
+    modified in place) to skip downloading it again.
+    """
+    try:
+        if root is None:
+            root = fetch_html_tree(url)
+        if root is None:
+            return None
         
         # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'ads']):
-            element.decompose()
+        etree.strip_elements(root, 'script', 'style', 'nav', 'header', 'footer', 'aside', 'ads',
+                             with_tail=False)
         
         # Try multiple selectors for article content
-        content_selectors = [
-            'article',
-            '[data-module="ArticleBody"]',
-            '.article-body',
-            '.story-body',
-            '.post-content',
-            '.entry-content',
-            '.content',
-            'main',
-            '.article-content'
-        ]
-        
         article_content = None
-        for selector in content_selectors:
-            content_element = soup.select_one(selector)
-            if content_element:
-                article_content = content_element.get_text(strip=True)
-                if len(article_content) > 200:  # Ensure we got substantial content
-                    break
+        for content_element in find_article_containers(root):
+            article_content = element_text(content_element, strip=True)
+            if len(article_content) > 200:  # Ensure we got substantial content
+                break
         
         if not article_content:
             # Fallback: get all paragraph text
-            paragraphs = soup.find_all('p')
-            article_content = '\n'.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
+            paragraphs = (element_text(p, strip=True) for p in root.iter('p'))
+            article_content = '\n'.join(text for text in paragraphs if text)
         
         return article_content if len(article_content) > 100 else None
         
@@ -538,109 +901,223 @@ def extract_full_article_content(url: str) -> Optional[str]:
         logger.info(f"Trying archive.is fallback for: {url}")
         return try_archive_fallback(url)
 
+# Lowercased, de-duplicated keywords; duplicates are reported so additions to
+# NEWS_KEYWORDS don't silently repeat an existing entry
+NEWS_KEYWORD_SET = frozenset(keyword.lower() for keyword in NEWS_KEYWORDS)
+if len(NEWS_KEYWORD_SET) < len(NEWS_KEYWORDS):
+    logger.warning(f"NEWS_KEYWORDS has {len(NEWS_KEYWORDS) - len(NEWS_KEYWORD_SET)} duplicate entries")
+
+# All keywords in one Aho-Corasick automaton, so a text is scanned once no
+# matter how many keywords there are. Each entry stores (length, keyword).
+KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for _keyword in NEWS_KEYWORD_SET:
+    KEYWORD_AUTOMATON.add_word(_keyword, (len(_keyword), _keyword))
+KEYWORD_AUTOMATON.make_automaton()
+
+def is_word_char(char: str) -> bool:
+    """Whether char is a regex word character (alphanumeric or '_')"""
+    return char.isalnum() or char == '_'
+
+def keyword_hits(lowered: str):
+    """Yield (offset, keyword) for each whole-word keyword hit in already-lowercased text"""
+    # Use word boundary matching for better accuracy: the automaton also hits
+    # keywords inside longer words ("war" in "software"), which are skipped.
+    # Every keyword starts and ends with a word character, so a hit is a whole
+    # word when the characters either side of it are not.
+    length = len(lowered)
+    for end, (keyword_length, keyword) in KEYWORD_AUTOMATON.iter(lowered):
+        start = end - keyword_length + 1
+        if ((start == 0 or not is_word_char(lowered[start - 1])) and
+                (end + 1 == length or not is_word_char(lowered[end + 1]))):
+            yield start, keyword
+
 def matches_keywords(text: str) -> bool:
     """Check if text contains any of our keywords"""
     if not text:
         return False
-    
-    text_lower = text.lower()
-    
-    # Use word boundary matching for better accuracy
-    import re
-    for keyword in NEWS_KEYWORDS:
-        keyword_lower = keyword.lower()
-        # Create a regex pattern that matches the keyword as a whole word
-        pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-        if re.search(pattern, text_lower):
-            return True
-    
-    return False
+    return next(keyword_hits(text.lower()), None) is not None
+
+def scan_keywords(text: str) -> Dict[str, int]:
+    """Every keyword found in text, mapped to the offset (in text.lower()) of its last hit"""
+    return {keyword: start for start, keyword in keyword_hits(text.lower())}
+
+def news_keywords_in(found: Dict[str, int]) -> List[str]:
+    """The NEWS_KEYWORDS entries in a scan_keywords result, as tag_article would list them"""
+    return [keyword for keyword in NEWS_KEYWORDS if keyword.lower() in found]
+
+def content_simhash(text: str) -> int:
+    """64-bit SimHash of text over word 3-shingles"""
+    words = re.findall(r'\w+', text.lower())
+    shingles = {' '.join(words[i:i + 3]) for i in range(max(1, len(words) - 2))}
+    # Lay the shingle hashes out as one bit string, then count each bit
+    # position with a strided slice instead of looping over bits in Python
+    bits = ''.join(
+        format(int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'big'), '064b')
+        for shingle in shingles
+    )
+    value = 0
+    for position in range(64):
+        if bits[position::64].count('1') * 2 > len(shingles):
+            value |= 1 << (63 - position)
+    return value
+
+def claim_content_simhash(simhash: int) -> bool:
+    """Record simhash unless a near-identical article was already stored; False if so"""
+    with _content_simhash_lock:
+        for existing in S3_CONTENT_SIMHASHES:
+            if bin(simhash ^ existing).count('1') <= SIMHASH_MAX_DISTANCE:
+                return False
+        S3_CONTENT_SIMHASHES.append(simhash)
+        return True
+
+def release_content_simhash(simhash: int):
+    """Drop a claimed simhash whose article failed to upload, so a reprint can still be stored"""
+    with _content_simhash_lock:
+        S3_CONTENT_SIMHASHES.remove(simhash)
+
+# Article URLs already queued for download this run, so a story listed by
+# several feeds (or sources) is fetched and parsed once. Oldest claims are
+# dropped past the cap.
+CLAIMED_URLS_MAX = 10000
+_claimed_urls = {}
+_claimed_urls_lock = threading.Lock()
+
+def claim_article_url(url: str) -> bool:
+    """Record url as being fetched this run; False if another feed already claimed it"""
+    canonical = url.split('#', 1)[0].rstrip('/')
+    with _claimed_urls_lock:
+        if canonical in _claimed_urls:
+            return False
+        _claimed_urls[canonical] = None
+        if len(_claimed_urls) > CLAIMED_URLS_MAX:
+            del _claimed_urls[next(iter(_claimed_urls))]
+        return True
 
 # -------------------------------------------------------------------------
 # RSS FEED PROCESSING
 # -------------------------------------------------------------------------
+# Article downloads from every feed share one bounded pool
+ARTICLE_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+def save_rss_article(feed_url: str, item: Dict, metadata_key: str, content_key: str) -> int:
+    """Fetch, tag and store one RSS article (runs on ARTICLE_EXECUTOR); returns 1 if saved"""
+    title = item['title']
+    link = item['link']
+    pub_date = item['pub_date']
+    description = item['description']
+    
+    try:
+        # Extract full article content
+        full_content = extract_full_article_content(link)
+        if not full_content:
+            logger.warning(f"Could not extract content from: {link}")
+            return 0
+        
+        simhash = content_simhash(full_content)
+        
+        # Tag the article with geographic and topical information
+        combined_text = title + ' ' + description + ' ' + full_content
+        tags = tag_article(combined_text, NEWS_KEYWORDS,
+                           matched_keywords=news_keywords_in(scan_keywords(combined_text)))
+        
+        # Add special tag for legislation when applicable (only from legislation feeds)
+        special_tags = []
+        try:
+            # Only tag from specific legislation feeds, not content-based heuristics
+            legislation_feeds = [
+                'congress.gov',
+                'bills.parliament.uk',
+                'eur-lex.europa.eu',
+                'aph.gov.au',  # Australian Parliament bills
+                'camara.leg.br',  # Brazilian Chamber
+                'senado.leg.br',  # Brazilian Senate
+                'pmg.org.za'  # South African Parliamentary Monitoring Group
+            ]
+            if any(legislative_domain in feed_url for legislative_domain in legislation_feeds):
+                special_tags.append('legislation')
+        except Exception:
+            pass
+        
+        # Create metadata with tagging information
+        metadata = {
+            'title': title,
+            'url': link,
+            'pub_date': pub_date,
+            'description': description,
+            'source': 'RSS Feed',
+            'feed_url': feed_url,
+            'content_length': len(full_content),
+            'collection_date': datetime.now().isoformat(),
+            'content_simhash': f"{simhash:016x}",
+            'tags': {**tags, 'special_tags': special_tags}
+        }
+        
+        # Skip reprints of an article we already stored under another URL. The
+        # claim is taken just before the upload and dropped if it fails, so a
+        # failed save never blocks the same story from another outlet.
+        if not claim_content_simhash(simhash):
+            logger.debug(f"Skipping near-duplicate content: {link}")
+            return 0
+        
+        # Save full content and metadata
+        saved = 0
+        if upload_article_to_s3(metadata, metadata_key, full_content, content_key):
+            saved = 1
+            record_manifest_entry(metadata_key, metadata)
+            progress_tracker.increment_articles()
+            add_processed_url(link)  # Track URL for future idempotency
+            logger.info(f"? Saved article: {title[:50]}...")
+        else:
+            release_content_simhash(simhash)
+        
+        return saved
+    except Exception as e:
+        logger.debug(f"Error processing RSS item: {str(e)}")
+        return 0
+
 def process_single_rss_feed(feed_url):
     """Process a single RSS feed - designed for parallel execution"""
+    # Completed feeds with saved validators are polled again; the conditional
+    # GET below keeps that to a 304 when nothing was published since. Without
+    # validators a re-poll would mean a full download and parse, so skip them.
     if progress_tracker.is_feed_complete(feed_url):
-        logger.info(f"Skipping completed feed: {feed_url}")
-        return 0
-        
-    logger.info(f"Processing RSS feed: {feed_url}")
-    feed_count = 0
+        if not progress_tracker.get_feed_validators(feed_url):
+            logger.info(f"Skipping completed feed: {feed_url}")
+            return 0
+        logger.info(f"Re-polling completed feed: {feed_url}")
+    else:
+        logger.info(f"Processing RSS feed: {feed_url}")
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(feed_url, headers=headers, timeout=10)  # Reduced timeout
+        # Conditional GET: unchanged feeds answer 304 with no body to parse
+        validators = progress_tracker.get_feed_validators(feed_url)
+        headers = {}
+        if validators.get("etag"):
+            headers['If-None-Match'] = validators["etag"]
+        if validators.get("modified"):
+            headers['If-Modified-Since'] = validators["modified"]
+        
+        # Feeds bypass the response cache; freshness is handled by the validators above
+        response = http_get(feed_url, headers=headers, expire_after=requests_cache.DO_NOT_CACHE,
+                            timeout=(HTTP_CONNECT_TIMEOUT, 10))  # Reduced timeout
+        if response.status_code == 304:
+            logger.info(f"Feed unchanged since last run: {feed_url}")
+            progress_tracker.mark_feed_complete(feed_url)
+            return 0
         response.raise_for_status()
         
-        # Try different parsing methods
-        soup = None
-        items = []
-        
-        # Method 1: XML parser (preferred for RSS/Atom)
-        try:
-            soup = BeautifulSoup(response.content, 'xml')
-            items = soup.find_all('item')
-            if not items:
-                items = soup.find_all('entry')  # Atom feeds
-        except:
-            pass
+        items = parse_feed_items(response.content)
         
-        # Method 2: lxml parser fallback
-        if not items:
-            try:
-                soup = BeautifulSoup(response.content, 'lxml')
-                items = soup.find_all('item')
-                if not items:
-                    items = soup.find_all('entry')  # Atom feeds
-            except:
-                pass
-        
-        # Method 3: HTML parser fallback
-        if not items:
-            try:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                items = soup.find_all('item')
-                if not items:
-                    items = soup.find_all('entry')  # Atom feeds
-            except:
-                pass
-        
-        # Process items from whichever parser succeeded
+        futures = []
+        seen_links = set()  # links already queued from this feed
         for item in items:
             try:
-                title = item.find('title').get_text() if item.find('title') else 'No Title'
-                
-                # Handle different link formats (RSS vs Atom)
-                link = None
-                if item.find('link'):
-                    link_elem = item.find('link')
-                    if link_elem.get('href'):  # Atom format
-                        link = link_elem.get('href')
-                    else:  # RSS format
-                        link = link_elem.get_text()
+                title = item['title']
+                link = item['link']
+                pub_date = item['pub_date']
+                description = item['description']
                 
-                # Handle different date formats
-                pub_date = ''
-                if item.find('pubDate'):
-                    pub_date = item.find('pubDate').get_text()
-                elif item.find('published'):  # Atom format
-                    pub_date = item.find('published').get_text()
-                elif item.find('updated'):  # Atom format
-                    pub_date = item.find('updated').get_text()
-                
-                # Handle different description formats
-                description = ''
-                if item.find('description'):
-                    description = item.find('description').get_text()
-                elif item.find('summary'):  # Atom format
-                    description = item.find('summary').get_text()
-                elif item.find('content'):  # Atom format
-                    description = item.find('content').get_text()
-                
-                if not link:
+                if not link or link in seen_links:
                     continue
                 
                 # Check for URL-based deduplication first (fastest check)
@@ -660,7 +1137,7 @@ def process_single_rss_feed(feed_url):
                     continue
                 
                 # Generate unique ID
-                article_id = hashlib.md5(link.encode()).hexdigest()
+                article_id = url_hash(link)
                 
                 # Check if already processed by file existence (backup check)
                 metadata_key = f"{S3_FOLDER_NEWS}/rss/metadata/{article_id}.json"
@@ -671,65 +1148,21 @@ def process_single_rss_feed(feed_url):
                     add_processed_url(link)  # Update our URL cache
                     continue
                 
-                # Extract full article content
-                full_content = extract_full_article_content(link)
-                if not full_content:
-                    logger.warning(f"Could not extract content from: {link}")
+                # Fetch, tag and upload the article on the shared article pool
+                seen_links.add(link)
+                if not claim_article_url(link):
+                    logger.debug(f"Already queued from another feed: {link}")
                     continue
-                
-                # Tag the article with geographic and topical information
-                combined_text = title + ' ' + description + ' ' + full_content
-                tags = tag_article(combined_text, NEWS_KEYWORDS)
-
-                # Add special tag for legislation when applicable (only from legislation feeds)
-                special_tags = []
-                try:
-                    # Only tag from specific legislation feeds, not content-based heuristics
-                    legislation_feeds = [
-                        'congress.gov',
-                        'bills.parliament.uk',
-                        'eur-lex.europa.eu',
-                        'aph.gov.au',  # Australian Parliament bills
-                        'camara.leg.br',  # Brazilian Chamber
-                        'senado.leg.br',  # Brazilian Senate
-                        'pmg.org.za'  # South African Parliamentary Monitoring Group
-                    ]
-                    if any(legislative_domain in feed_url for legislative_domain in legislation_feeds):
-                        special_tags.append('legislation')
-                except Exception:
-                    pass
-                
-                # Create metadata with tagging information
-                metadata = {
-                    'title': title,
-                    'url': link,
-                    'pub_date': pub_date,
-                    'description': description,
-                    'source': 'RSS Feed',
-                    'feed_url': feed_url,
-                    'content_length': len(full_content),
-                    'collection_date': datetime.now().isoformat(),
-                    'tags': {**tags, 'special_tags': special_tags}
-                }
-                
-                # Save metadata
-                if upload_to_s3_if_not_exists(
-                    json.dumps(metadata, indent=2).encode("utf-8"),
-                    metadata_key,
-                    "application/json"
-                ):
-                    # Save full content
-                    if upload_to_s3_if_not_exists(full_content.encode('utf-8'), content_key):
-                        feed_count += 1
-                        progress_tracker.increment_articles()
-                        add_processed_url(link)  # Track URL for future idempotency
-                        logger.info(f"? Saved article: {title[:50]}...")
-                
-                time.sleep(0.5)  # Rate limiting
+                futures.append(ARTICLE_EXECUTOR.submit(save_rss_article, feed_url, item, metadata_key, content_key))
                 
             except Exception as e:
                 logger.debug(f"Error processing RSS item: {str(e)}")
                 continue
+        
+        feed_count = sum(future.result() for future in futures)
+        progress_tracker.set_feed_validators(
+            feed_url, response.headers.get('ETag'), response.headers.get('Last-Modified')
+        )
         progress_tracker.mark_feed_complete(feed_url)
         logger.info(f"Completed feed: {feed_url} ({feed_count} articles)")
         return feed_count
@@ -742,9 +1175,10 @@ def process_rss_feeds():
     """Process RSS feeds in parallel for 2025 news articles"""
     logger.info("=== RSS FEEDS: Starting ===")
     
-    # Filter out already completed feeds
-    feeds_to_process = [feed for feed in NEWS_SOURCES['rss_feeds'] 
-                       if not progress_tracker.is_feed_complete(feed)]
+    # Completed feeds are only re-polled when a conditional GET is possible
+    feeds_to_process = [feed for feed in NEWS_SOURCES['rss_feeds']
+                         if not progress_tracker.is_feed_complete(feed)
+                         or progress_tracker.get_feed_validators(feed)]
     
     if not feeds_to_process:
         logger.info("All RSS feeds already completed")
@@ -762,6 +1196,117 @@ def process_rss_feeds():
 # -------------------------------------------------------------------------
 # DIRECT WEBSITE SCRAPING
 # -------------------------------------------------------------------------
+# Article-like hrefs on listing pages (section paths or dated permalinks)
+ARTICLE_HREF_RE = re.compile(r'/(article|news|story|post|press|blog|202\d)/', re.I)
+
+# Selectors below are compiled once at import rather than on every page
+# Hrefs of headline anchors (.article-link a, .story-link a, .headline a, h1 a, h2 a, h3 a)
+HEADLINE_LINK_XPATH = etree.XPath(' | '.join(
+    [f"{class_xpath(name)}//a/@href" for name in ('article-link', 'story-link', 'headline')] +
+    [f"//{heading}//a/@href" for heading in ('h1', 'h2', 'h3')]
+))
+# Page title, falling back to the first heading
+TITLE_XPATH = etree.XPath('//title')
+H1_XPATH = etree.XPath('//h1')
+# Publication date elements, in order of preference ([datetime], .publish-date, ..., time)
+ARTICLE_DATE_XPATHS = [etree.XPath(xpath) for xpath in (
+    '//*[@datetime]',
+    class_xpath('publish-date'),
+    class_xpath('article-date'),
+    class_xpath('post-date'),
+    '//time'
+)]
+
+def add_article_link(article_links: set, base_url: str, href: str):
+    """Normalize a listing-page href and add it to the candidate set"""
+    if href.startswith('/'):
+        href = urljoin(base_url, href)
+    if href.startswith('http') and len(href) > 10:
+        article_links.add(href)
+
+def save_direct_article(base_url: str, article_url: str, metadata_key: str, content_key: str) -> int:
+    """Fetch, filter, tag and store one scraped article (runs on ARTICLE_EXECUTOR); returns 1 if saved"""
+    try:
+        # Get article page
+        article_root = fetch_html_tree(article_url)
+        if article_root is None:
+            return 0
+        
+        # Extract title
+        title_elements = TITLE_XPATH(article_root) or H1_XPATH(article_root)
+        title = element_text(title_elements[0]).strip() if title_elements else 'No Title'
+        
+        # Check if matches keywords
+        if not matches_keywords(title):
+            return 0
+        
+        # Extract date (try multiple selectors)
+        article_date = None
+        for xpath in ARTICLE_DATE_XPATHS:
+            date_elements = xpath(article_root)
+            if date_elements:
+                article_date = date_elements[0].get('datetime') or element_text(date_elements[0])
+                break
+        
+        # Check if 2025 article
+        if article_date and not is_2025_article(article_date):
+            return 0
+        
+        # Extract full content from the page already fetched above
+        full_content = extract_full_article_content(article_url, root=article_root)
+        if not full_content:
+            return 0
+        
+        # One keyword scan over title + content serves both the content
+        # check and the tags: hits past the title are in the content
+        combined_text = title + ' ' + full_content
+        found_keywords = scan_keywords(combined_text)
+        content_start = len(title.lower()) + 1
+        if not any(start >= content_start for start in found_keywords.values()):
+            return 0
+        
+        simhash = content_simhash(full_content)
+        
+        # Tag the article with geographic and topical information
+        tags = tag_article(combined_text, NEWS_KEYWORDS,
+                           matched_keywords=news_keywords_in(found_keywords))
+        
+        # Create metadata with tagging information
+        metadata = {
+            'title': title,
+            'url': article_url,
+            'date': article_date or 'Unknown',
+            'source': 'Direct Scraping',
+            'base_url': base_url,
+            'content_length': len(full_content),
+            'collection_date': datetime.now().isoformat(),
+            'content_simhash': f"{simhash:016x}",
+            'tags': tags
+        }
+        
+        # Skip reprints of an article we already stored under another URL. The
+        # claim is taken just before the upload and dropped if it fails, so a
+        # failed save never blocks the same story from another outlet.
+        if not claim_content_simhash(simhash):
+            logger.debug(f"Skipping near-duplicate content: {article_url}")
+            return 0
+        
+        # Save full content and metadata
+        saved = 0
+        if upload_article_to_s3(metadata, metadata_key, full_content, content_key):
+            saved = 1
+            record_manifest_entry(metadata_key, metadata)
+            progress_tracker.increment_articles()
+            add_processed_url(article_url)  # Track URL for future idempotency
+            logger.info(f"? Scraped article: {title[:50]}...")
+        else:
+            release_content_simhash(simhash)
+        
+        return saved
+    except Exception as e:
+        logger.debug(f"Error scraping article {article_url}: {str(e)}")
+        return 0
+
 def scrape_website_articles(base_url: str, max_articles: int = 50):
     """Scrape articles directly from news websites"""
     if progress_tracker.is_source_complete(base_url):
@@ -772,41 +1317,26 @@ def scrape_website_articles(base_url: str, max_articles: int = 50):
     articles_found = 0
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(base_url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find article links
-        article_selectors = [
-            'a[href*="/article/"]',
-            'a[href*="/news/"]', 
-            'a[href*="/story/"]',
-            'a[href*="/post/"]',
-            'a[href*="/blog/"]',
-            '.article-link a',
-            '.story-link a',
-            '.headline a',
-            'h1 a', 'h2 a', 'h3 a'
-        ]
-        
+        root = fetch_html_tree(base_url)
+        if root is None:
+            raise ValueError("empty listing page")
+
+        # Find article links in a single pass over the anchors
         article_links = set()
-        for selector in article_selectors:
-            links = soup.select(selector)
-            for link in links:
-                href = link.get('href')
+        for href in ANCHOR_HREFS_XPATH(root):
+            if not ARTICLE_HREF_RE.search(href):
+                continue
+            add_article_link(article_links, base_url, href)
+
+        # Fallback: headline anchors, only when no article-like hrefs were found
+        if not article_links:
+            for href in HEADLINE_LINK_XPATH(root):
                 if href:
-                    if href.startswith('/'):
-                        href = urljoin(base_url, href)
-                    if href.startswith('http') and len(href) > 10:
-                        article_links.add(href)
+                    add_article_link(article_links, base_url, href)
         
         logger.info(f"Found {len(article_links)} potential articles on {base_url}")
         
+        futures = []
         for article_url in list(article_links)[:max_articles]:
             try:
                 # Check for URL-based deduplication first (fastest check)
@@ -815,7 +1345,7 @@ def scrape_website_articles(base_url: str, max_articles: int = 50):
                     continue
                 
                 # Generate unique ID
-                article_id = hashlib.md5(article_url.encode()).hexdigest()
+                article_id = url_hash(article_url)
                 
                 # Check if already processed by file existence (backup check)
                 metadata_key = f"{S3_FOLDER_NEWS}/direct/metadata/{article_id}.json"
@@ -826,84 +1356,20 @@ def scrape_website_articles(base_url: str, max_articles: int = 50):
                     add_processed_url(article_url)  # Update our URL cache
                     continue
                 
-                # Get article page
-                article_response = requests.get(article_url, headers=headers, timeout=30)
-                article_response.raise_for_status()
-                
-                article_soup = BeautifulSoup(article_response.content, 'html.parser')
-                
-                # Extract title
-                title_element = article_soup.find('title') or article_soup.find('h1')
-                title = title_element.get_text().strip() if title_element else 'No Title'
-                
-                # Check if matches keywords
-                if not matches_keywords(title):
-                    continue
-                
-                # Extract date (try multiple selectors)
-                date_selectors = [
-                    '[datetime]',
-                    '.publish-date',
-                    '.article-date', 
-                    '.post-date',
-                    'time'
-                ]
-                
-                article_date = None
-                for selector in date_selectors:
-                    date_element = article_soup.select_one(selector)
-                    if date_element:
-                        article_date = date_element.get('datetime') or date_element.get_text()
-                        break
-                
-                # Check if 2025 article
-                if article_date and not is_2025_article(article_date):
-                    continue
-                
-                # Extract full content
-                full_content = extract_full_article_content(article_url)
-                if not full_content:
-                    continue
-                
-                # Check content for keywords too
-                if not matches_keywords(full_content):
+                if not claim_article_url(article_url):
+                    logger.debug(f"Already queued from another source: {article_url}")
                     continue
                 
-                # Tag the article with geographic and topical information
-                combined_text = title + ' ' + full_content
-                tags = tag_article(combined_text, NEWS_KEYWORDS)
-                
-                # Create metadata with tagging information
-                metadata = {
-                    'title': title,
-                    'url': article_url,
-                    'date': article_date or 'Unknown',
-                    'source': 'Direct Scraping',
-                    'base_url': base_url,
-                    'content_length': len(full_content),
-                    'collection_date': datetime.now().isoformat(),
-                    'tags': tags
-                }
-                
-                # Save metadata
-                if upload_to_s3_if_not_exists(
-                    json.dumps(metadata, indent=2).encode("utf-8"),
-                    metadata_key,
-                    "application/json"
-                ):
-                    # Save full content
-                    if upload_to_s3_if_not_exists(full_content.encode('utf-8'), content_key):
-                        articles_found += 1
-                        progress_tracker.increment_articles()
-                        add_processed_url(article_url)  # Track URL for future idempotency
-                        logger.info(f"? Scraped article: {title[:50]}...")
-                
-                time.sleep(1)  # Rate limiting
+                # Fetch, filter, tag and upload the article on the shared article pool
+                futures.append(ARTICLE_EXECUTOR.submit(
+                    save_direct_article, base_url, article_url, metadata_key, content_key
+                ))
                 
             except Exception as e:
                 logger.debug(f"Error scraping article {article_url}: {str(e)}")
                 continue
         
+        articles_found = sum(future.result() for future in futures)
         progress_tracker.mark_source_complete(base_url)
         
     except Exception as e:
@@ -920,201 +1386,126 @@ def process_direct_scraping():
         articles_count = scrape_website_articles(source_url)
         total_processed += articles_count
         logger.info(f"Completed source: {source_url} ({articles_count} articles)")
-        time.sleep(3)  # Rate limiting between sites
     
     logger.info(f"=== DIRECT SCRAPING: Complete ({total_processed} total articles) ===")
 
 # -------------------------------------------------------------------------
 # HTML INDEX GENERATORS
 # -------------------------------------------------------------------------
-def generate_date_html_index():
-    """Generate HTML index file for the current date's collected articles"""
-    logger.info("?? Generating date HTML index...")
-    
-    try:
-        # Get all metadata files from today's folder
-        metadata_files = []
-        
-        # Get all metadata files from today's folder (including RSS, direct, and legislation)
-        try:
-            paginator = s3_client.get_paginator('list_objects_v2')
-            # Scan all subfolders under today's folder for metadata files
-            page_iterator = paginator.paginate(
-                Bucket=S3_BUCKET_NAME,
-                Prefix=f"{S3_FOLDER_NEWS}/"
-            )
-            
-            for page in page_iterator:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        # Match any metadata file in any subfolder (rss/metadata/, direct/metadata/, metadata/, etc.)
-                        if obj['Key'].endswith('.json') and '/metadata/' in obj['Key']:
-                            metadata_files.append(obj['Key'])
-        except Exception as e:
-            logger.debug(f"Error listing metadata files: {e}")
-        
-        if not metadata_files:
-            logger.warning("No metadata files found to generate HTML index")
-            return False
-        
-        # Load all metadata
-        articles = []
-        for metadata_file in metadata_files:
-            try:
-                response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=metadata_file)
-                metadata = json.loads(response['Body'].read().decode('utf-8'))
-                articles.append(metadata)
-            except Exception as e:
-                logger.debug(f"Error loading metadata file {metadata_file}: {e}")
-                continue
-        
-        # Sort articles by publication date (newest first)
-        def sort_key(article):
-            try:
-                # Try to parse the pub_date
-                if 'pub_date' in article and article['pub_date']:
-                    from dateutil import parser
-                    parsed_date = parser.parse(article['pub_date'])
-                    # Make timezone-naive for comparison
-                    if parsed_date.tzinfo is not None:
-                        parsed_date = parsed_date.replace(tzinfo=None)
-                    return parsed_date
-                elif 'date' in article and article['date']:
-                    from dateutil import parser
-                    parsed_date = parser.parse(article['date'])
-                    # Make timezone-naive for comparison
-                    if parsed_date.tzinfo is not None:
-                        parsed_date = parsed_date.replace(tzinfo=None)
-                    return parsed_date
-                else:
-                    return datetime.min
-            except:
-                return datetime.min
-        
-        articles.sort(key=sort_key, reverse=True)
-        
-        # Generate HTML content
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>News Collection - {today}</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <link rel="stylesheet" href="https://asoba.co/includes/common.css">
-    <style>
-        body {{
+# Static stylesheet for the per-date index page, kept out of the page f-string
+DATE_INDEX_CSS = """\
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             line-height: 1.6;
             margin: 0;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             text-align: center;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 2.5em;
             font-weight: 300;
-        }}
-        .header p {{
+        }
+        .header p {
             margin: 10px 0 0 0;
             opacity: 0.9;
             font-size: 1.1em;
-        }}
-        .stats {{
+        }
+        .stats {
             display: flex;
             justify-content: center;
             gap: 30px;
             margin-top: 20px;
-        }}
-        .stat {{
+        }
+        .stat {
             text-align: center;
-        }}
-        .stat-number {{
+        }
+        .stat-number {
             font-size: 2em;
             font-weight: bold;
             display: block;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             font-size: 0.9em;
             opacity: 0.8;
-        }}
-        .content {{
+        }
+        .content {
             padding: 30px;
-        }}
-        .article {{
+        }
+        .article {
             border-bottom: 1px solid #eee;
             padding: 20px 0;
             transition: background-color 0.2s;
-        }}
-        .article:hover {{
+        }
+        .article:hover {
             background-color: #f9f9f9;
-        }}
-        .article:last-child {{
+        }
+        .article:last-child {
             border-bottom: none;
-        }}
-        .article-title {{
+        }
+        .article-title {
             margin: 0 0 10px 0;
             font-size: 1.3em;
             font-weight: 600;
-        }}
-        .article-title a {{
+        }
+        .article-title a {
             color: #333;
             text-decoration: none;
             transition: color 0.2s;
-        }}
-        .article-title a:hover {{
+        }
+        .article-title a:hover {
             color: #667eea;
-        }}
-        .article-meta {{
+        }
+        .article-meta {
             display: flex;
             gap: 15px;
             margin-bottom: 10px;
             font-size: 0.9em;
             color: #666;
-        }}
-        .article-source {{
+        }
+        .article-source {
             background: #e3f2fd;
             color: #1976d2;
             padding: 2px 8px;
             border-radius: 12px;
             font-size: 0.8em;
             font-weight: 500;
-        }}
-        .article-date {{
+        }
+        .article-date {
             color: #888;
-        }}
-        .article-length {{
+        }
+        .article-length {
             color: #888;
-        }}
-        .article-description {{
+        }
+        .article-description {
             color: #555;
             margin-top: 10px;
             line-height: 1.5;
-        }}
-        .article-description p {{
+        }
+        .article-description p {
             margin: 0 0 10px 0;
-        }}
-        .article-description p:last-child {{
+        }
+        .article-description p:last-child {
             margin-bottom: 0;
-        }}
-        .view-content {{
+        }
+        .view-content {
             margin-top: 15px;
-        }}
-        .view-content a {{
+        }
+        .view-content a {
             display: inline-block;
             background: #667eea;
             color: white;
@@ -1123,94 +1514,174 @@ def generate_date_html_index():
             border-radius: 4px;
             font-size: 0.9em;
             transition: background-color 0.2s;
-        }}
-        .view-content a:hover {{
+        }
+        .view-content a:hover {
             background: #5a6fd8;
-        }}
-        .filters {{
+        }
+        .filters {
             margin-bottom: 30px;
             padding: 20px;
             background: #f8f9fa;
             border-radius: 6px;
-        }}
-        .filter-group {{
+        }
+        .filter-group {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             align-items: center;
-        }}
-        .filter-group label {{
+        }
+        .filter-group label {
             font-weight: 500;
             color: #333;
             margin-bottom: 5px;
             display: block;
-        }}
-        .filter-group select, .filter-group input {{
+        }
+        .filter-group select, .filter-group input {
             padding: 8px 12px;
             border: 1px solid #ddd;
             border-radius: 4px;
             font-size: 0.9em;
             width: 100%;
-        }}
-        .filter-row {{
+        }
+        .filter-row {
             display: flex;
             flex-direction: column;
-        }}
-        .back-link {{
+        }
+        .back-link {
             margin-bottom: 20px;
-        }}
-        .back-link a {{
+        }
+        .back-link a {
             color: #667eea;
             text-decoration: none;
             font-weight: 500;
-        }}
-        .back-link a:hover {{
+        }
+        .back-link a:hover {
             text-decoration: underline;
-        }}
-        .article-tags {{
+        }
+        .article-tags {
             margin: 10px 0;
             display: flex;
             flex-wrap: wrap;
             gap: 5px;
-        }}
-        .tag {{
+        }
+        .tag {
             display: inline-block;
             padding: 2px 8px;
             border-radius: 12px;
             font-size: 0.8em;
             font-weight: 500;
-        }}
-        .tag-continent {{
+        }
+        .tag-continent {
             background: #e3f2fd;
             color: #1976d2;
-        }}
-        .tag-topic {{
+        }
+        .tag-topic {
             background: #f3e5f5;
             color: #7b1fa2;
-        }}
-        .tag-keywords {{
+        }
+        .tag-keywords {
             background: #e8f5e8;
             color: #2e7d32;
-        }}
-        .tag-special {{
+        }
+        .tag-special {
             background: #fff3e0;
             color: #e65100;
-        }}
-        @media (max-width: 768px) {{
-            .stats {{
+        }
+        @media (max-width: 768px) {
+            .stats {
                 flex-direction: column;
                 gap: 15px;
-            }}
-            .filter-group {{
+            }
+            .filter-group {
                 flex-direction: column;
                 align-items: flex-start;
-            }}
-            .article-meta {{
+            }
+            .article-meta {
                 flex-direction: column;
                 gap: 5px;
-            }}
-        }}
-    </style>
+            }
+        }"""
+
+# Static tail of the per-date index page: closes the article list and adds
+# the client-side filter script
+DATE_INDEX_FOOTER = """
+            </div>
+        </div>
+    </div>
+    
+    <script>
+        // Filter functionality
+        const sourceFilter = document.getElementById('sourceFilter');
+        const continentFilter = document.getElementById('continentFilter');
+        const topicFilter = document.getElementById('topicFilter');
+        const keywordFilter = document.getElementById('keywordFilter');
+        const specialFilter = document.getElementById('specialFilter');
+        const searchInput = document.getElementById('searchInput');
+        const articlesList = document.getElementById('articlesList');
+        
+        function filterArticles() {
+            if (!sourceFilter || !continentFilter || !topicFilter || !keywordFilter || !specialFilter || !searchInput) {
+                return;
+            }
+            const articles = document.querySelectorAll('.article');
+            const selectedSource = sourceFilter.value.toLowerCase();
+            const selectedContinent = continentFilter.value;
+            const selectedTopic = topicFilter.value;
+            const selectedKeyword = keywordFilter.value.toLowerCase();
+            const selectedSpecial = specialFilter.value;
+            const searchTerm = searchInput.value.toLowerCase();
+            
+            articles.forEach(article => {
+                const source = article.dataset.source.toLowerCase();
+                const title = article.dataset.title;
+                const description = article.dataset.description;
+                const continents = (article.dataset.continents || '').split(' ').filter(c => c);
+                const topics = (article.dataset.topics || '').split(' ').filter(t => t);
+                const keywords = (article.dataset.keywords || '').split(' ').filter(k => k);
+                const special = (article.dataset.special || '').split(' ').filter(s => s);
+                
+                const sourceMatch = !selectedSource || source.includes(selectedSource);
+                const continentMatch = !selectedContinent || continents.includes(selectedContinent);
+                const topicMatch = !selectedTopic || topics.includes(selectedTopic);
+                const keywordMatch = !selectedKeyword || keywords.some(k => k.toLowerCase().includes(selectedKeyword));
+                const specialMatch = !selectedSpecial || special.includes(selectedSpecial);
+                const searchMatch = !searchTerm || title.includes(searchTerm) || description.includes(searchTerm);
+                
+                if (sourceMatch && continentMatch && topicMatch && specialMatch && keywordMatch && searchMatch) {
+                    article.style.display = 'block';
+                } else {
+                    article.style.display = 'none';
+                }
+            });
+        }
+        
+        sourceFilter.addEventListener('change', filterArticles);
+        continentFilter.addEventListener('change', filterArticles);
+        topicFilter.addEventListener('change', filterArticles);
+        keywordFilter.addEventListener('change', filterArticles);
+        specialFilter.addEventListener('change', filterArticles);
+        searchInput.addEventListener('input', filterArticles);
+        
+        // Initialize
+        filterArticles();
+    </script>
+    </main>
+</body>
+</html>"""
+
+# Per-date index page, compiled once at import. Autoescaping keeps titles and
+# descriptions from feeds from injecting markup into the page.
+DATE_INDEX_TEMPLATE_SOURCE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>News Collection - {{ today }}</title>
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    <link rel="stylesheet" href="https://asoba.co/includes/common.css">
+    <style>
+""" + DATE_INDEX_CSS + """
+    </style>
 </head>
 <body>
     <header class="header-bar">
@@ -1233,18 +1704,18 @@ def generate_date_html_index():
         <div class="container">
             <div class="header">
                 <h1>?? News Collection</h1>
-            <p>Energy, AI, and Blockchain News - {today}</p>
+            <p>Energy, AI, and Blockchain News - {{ today }}</p>
             <div class="stats">
                 <div class="stat">
-                    <span class="stat-number">{len(articles)}</span>
+                    <span class="stat-number">{{ articles|length }}</span>
                     <span class="stat-label">Articles</span>
                 </div>
                 <div class="stat">
-                    <span class="stat-number">{len(set(article.get('source', 'Unknown') for article in articles))}</span>
+                    <span class="stat-number">{{ sources|length }}</span>
                     <span class="stat-label">Sources</span>
                 </div>
                 <div class="stat">
-                    <span class="stat-number">{sum(article.get('content_length', 0) for article in articles) // 1000}K</span>
+                    <span class="stat-number">{{ total_length // 1000 }}K</span>
                     <span class="stat-label">Words</span>
                 </div>
             </div>
@@ -1261,7 +1732,7 @@ def generate_date_html_index():
                         <label for="sourceFilter">Filter by source:</label>
                         <select id="sourceFilter">
                             <option value="">All sources</option>
-                            {''.join(f'<option value="{source}">{source}</option>' for source in sorted(set(article.get('source', 'Unknown') for article in articles)))}
+                            {% for source in sources %}<option value="{{ source }}">{{ source }}</option>{% endfor %}
                         </select>
                     </div>
                     <div class="filter-row">
@@ -1298,7 +1769,7 @@ def generate_date_html_index():
                         <label for="keywordFilter">Filter by keyword:</label>
                         <select id="keywordFilter">
                             <option value="">All keywords</option>
-                            {''.join(f'<option value="{keyword}">{keyword.title()}</option>' for keyword in sorted(set([kw for article in articles for kw in article.get('tags', {}).get('matched_keywords', [])])))}
+                            {% for keyword, label in keyword_options %}<option value="{{ keyword }}">{{ label }}</option>{% endfor %}
                         </select>
                     </div>
                     <div class="filter-row">
@@ -1308,163 +1779,170 @@ def generate_date_html_index():
                 </div>
             </div>
             
-            <div id="articlesList">"""
-        
-        # Add articles
-        for i, article in enumerate(articles):
-            # Extract article ID from metadata file path or generate from URL
-            article_id = hashlib.md5(article['url'].encode()).hexdigest()
-            
-            # Determine content file path based on actual metadata file location
-            metadata_path = article.get('_metadata_path', '')
-            if '/rss/metadata/' in metadata_path:
-                content_path = f"rss/content/{article_id}.html"
-            elif '/direct/metadata/' in metadata_path:
-                content_path = f"direct/content/{article_id}.html"
-            else:
-                # Legislation articles or other sources saved directly to metadata/ and content/
-                content_path = f"content/{article_id}.html"
-            
-            # Format publication date
-            pub_date = article.get('pub_date', article.get('date', 'Unknown'))
-            if pub_date != 'Unknown':
-                try:
-                    from dateutil import parser
-                    parsed_date = parser.parse(pub_date)
-                    formatted_date = parsed_date.strftime('%B %d, %Y at %I:%M %p')
-                except:
-                    formatted_date = pub_date
-            else:
-                formatted_date = 'Unknown'
-            
-            # Clean description HTML
-            description = article.get('description', '')
-            if description:
-                # Remove HTML tags for display
-                soup = BeautifulSoup(description, 'html.parser')
-                description = soup.get_text()[:300] + ('...' if len(soup.get_text()) > 300 else '')
-            
-            # Extract tag information
-            tags = article.get('tags', {})
-            continents = tags.get('continents', [])
-            core_topics = tags.get('core_topics', [])
-            matched_keywords = tags.get('matched_keywords', [])
-            special_tags = tags.get('special_tags', [])
-            
-            # Create tag display
-            tag_elements = []
-            if continents:
-                tag_elements.append(f'<span class="tag tag-continent">{" ".join(continents)}</span>')
-            if core_topics:
-                tag_elements.append(f'<span class="tag tag-topic">{" ".join(core_topics)}</span>')
-            if special_tags:
-                tag_elements.append(f'<span class="tag tag-special">{" ".join(special_tags)}</span>')
-            if matched_keywords:
-                tag_elements.append(f'<span class="tag tag-keywords">{" ".join(matched_keywords[:3])}</span>')
-            
-            tags_html = ''.join(tag_elements)
-            
-            # Create data attributes for filtering
-            continents_str = ' '.join(continents) if continents else ''
-            topics_str = ' '.join(core_topics) if core_topics else ''
-            special_str = ' '.join(special_tags) if special_tags else ''
-            keywords_str = ' '.join(matched_keywords) if matched_keywords else ''
-            
-            html_content += f"""
-                <div class="article" data-source="{article.get('source', 'Unknown')}" data-title="{article.get('title', '').lower()}" data-description="{description.lower()}" data-continents="{continents_str}" data-topics="{topics_str}" data-special="{special_str}" data-keywords="{keywords_str}">
+            <div id="articlesList">{% for article in articles %}
+                <div class="article" data-source="{{ article.source }}" data-title="{{ article.data_title }}" data-description="{{ article.description|lower }}" data-continents="{{ article.continents|join(' ') }}" data-topics="{{ article.core_topics|join(' ') }}" data-special="{{ article.special_tags|join(' ') }}" data-keywords="{{ article.matched_keywords|join(' ') }}">
                     <h3 class="article-title">
-                        <a href="{article['url']}" target="_blank">{article.get('title', 'No Title')}</a>
+                        <a href="{{ article.url }}" target="_blank">{{ article.title }}</a>
                     </h3>
                     <div class="article-meta">
-                        <span class="article-source">{article.get('source', 'Unknown')}</span>
-                        <span class="article-date">{formatted_date}</span>
-                        <span class="article-length">{article.get('content_length', 0):,} chars</span>
+                        <span class="article-source">{{ article.source }}</span>
+                        <span class="article-date">{{ article.formatted_date }}</span>
+                        <span class="article-length">{{ '{:,}'.format(article.content_length) }} chars</span>
                     </div>
-                    {'<div class="article-tags">' + tags_html + '</div>' if tags_html else ''}
-                    {'<div class="article-description">' + description + '</div>' if description else ''}
+                    {% if article.continents or article.core_topics or article.special_tags or article.matched_keywords %}<div class="article-tags">{% if article.continents %}<span class="tag tag-continent">{{ article.continents|join(' ') }}</span>{% endif %}{% if article.core_topics %}<span class="tag tag-topic">{{ article.core_topics|join(' ') }}</span>{% endif %}{% if article.special_tags %}<span class="tag tag-special">{{ article.special_tags|join(' ') }}</span>{% endif %}{% if article.matched_keywords %}<span class="tag tag-keywords">{{ article.matched_keywords[:3]|join(' ') }}</span>{% endif %}</div>{% endif %}
+                    {% if article.description %}<div class="article-description">{{ article.description }}</div>{% endif %}
                     <div class="view-content">
-                        <a href="{content_path}" target="_blank"><i class="fas fa-file-alt"></i> View Full Content</a>
+                        <a href="{{ article.content_path }}" target="_blank"><i class="fas fa-file-alt"></i> View Full Content</a>
                     </div>
-                </div>"""
-        
-        html_content += """
-            </div>
-        </div>
-    </div>
+                </div>{% endfor %}""" + DATE_INDEX_FOOTER
+DATE_INDEX_TEMPLATE = jinja2.Environment(
+    loader=jinja2.DictLoader({'date_index.html': DATE_INDEX_TEMPLATE_SOURCE}),
+    autoescape=True
+).get_template('date_index.html')
+
+def date_index_fingerprint(listing: List) -> str:
+    """Digest of the (key, size, etag) metadata listing and the page template.
     
-    <script>
-        // Filter functionality
-        const sourceFilter = document.getElementById('sourceFilter');
-        const continentFilter = document.getElementById('continentFilter');
-        const topicFilter = document.getElementById('topicFilter');
-        const keywordFilter = document.getElementById('keywordFilter');
-        const specialFilter = document.getElementById('specialFilter');
-        const searchInput = document.getElementById('searchInput');
-        const articlesList = document.getElementById('articlesList');
+    Stored as object metadata on the date index; an equal fingerprint on the
+    next run means neither the articles nor the page layout have changed.
+    """
+    digest = hashlib.blake2b(DATE_INDEX_TEMPLATE_SOURCE.encode('utf-8'), digest_size=16)
+    for key, size, etag in sorted(listing):
+        digest.update(f"\n{key}\t{size}\t{etag}".encode('utf-8'))
+    return digest.hexdigest()
+
+# YYYY-MM-DDTHH:MM:SS prefix of an ISO 8601 timestamp
+ISO_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}')
+
+# Feed descriptions only need their tags dropped, not a full parse
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+def gzip_chunks(chunks, compresslevel: int = 6) -> bytes:
+    """Gzip an iterable of str chunks as UTF-8 without joining them first"""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=compresslevel, mtime=0) as gz:
+        for chunk in chunks:
+            gz.write(chunk.encode('utf-8'))
+    return buffer.getvalue()
+
+def date_index_article_view(article: Dict) -> Dict:
+    """Display fields for one article card on the date index page"""
+    # Content lives next to the metadata file: <subfolder>/content/<id>.html
+    # (rss/, direct/, or the date folder itself for legislation articles)
+    metadata_path = article['_metadata_path'][len(S3_FOLDER_NEWS) + 1:]
+    content_path = metadata_path.replace('metadata/', 'content/', 1)[:-len('.json')] + '.html'
+    
+    # Format publication date
+    pub_date = article.get('pub_date', article.get('date', 'Unknown'))
+    if pub_date != 'Unknown':
+        parsed_date = parse_article_date(pub_date) if isinstance(pub_date, str) else None
+        formatted_date = parsed_date.strftime('%B %d, %Y at %I:%M %p') if parsed_date else pub_date
+    else:
+        formatted_date = 'Unknown'
+    
+    # Clean description HTML
+    description = article.get('description', '')
+    if description:
+        # Remove HTML tags for display (the template escapes the result)
+        text = html_unescape(HTML_TAG_RE.sub('', description))
+        description = text[:300] + ('...' if len(text) > 300 else '')
+    
+    tags = article.get('tags', {})
+    return {
+        'url': article['url'],
+        'title': article.get('title', 'No Title'),
+        'data_title': article.get('title', '').lower(),
+        'source': article.get('source', 'Unknown'),
+        'formatted_date': formatted_date,
+        'content_length': article.get('content_length', 0),
+        'description': description,
+        'content_path': content_path,
+        'continents': tags.get('continents', []),
+        'core_topics': tags.get('core_topics', []),
+        'special_tags': tags.get('special_tags', []),
+        'matched_keywords': tags.get('matched_keywords', [])
+    }
+
+
+def generate_date_html_index():
+    """Generate HTML index file for the current date's collected articles.
+
+    Returns (success, articles) so the loaded metadata can be reused by
+    generate_master_html_index; articles is None if loading failed or the
+    index was already up to date.
+    """
+    logger.info("?? Generating date HTML index...")
+    
+    try:
+        # Get all metadata files from today's folder (including RSS, direct, and legislation)
+        metadata_files, _, listing = list_today_metadata_files()
         
-        function filterArticles() {
-            if (!sourceFilter || !continentFilter || !topicFilter || !keywordFilter || !specialFilter || !searchInput) {
-                return;
-            }
-            const articles = document.querySelectorAll('.article');
-            const selectedSource = sourceFilter.value.toLowerCase();
-            const selectedContinent = continentFilter.value;
-            const selectedTopic = topicFilter.value;
-            const selectedKeyword = keywordFilter.value.toLowerCase();
-            const selectedSpecial = specialFilter.value;
-            const searchTerm = searchInput.value.toLowerCase();
-            
-            articles.forEach(article => {
-                const source = article.dataset.source.toLowerCase();
-                const title = article.dataset.title;
-                const description = article.dataset.description;
-                const continents = (article.dataset.continents || '').split(' ').filter(c => c);
-                const topics = (article.dataset.topics || '').split(' ').filter(t => t);
-                const keywords = (article.dataset.keywords || '').split(' ').filter(k => k);
-                const special = (article.dataset.special || '').split(' ').filter(s => s);
-                
-                const sourceMatch = !selectedSource || source.includes(selectedSource);
-                const continentMatch = !selectedContinent || continents.includes(selectedContinent);
-                const topicMatch = !selectedTopic || topics.includes(selectedTopic);
-                const keywordMatch = !selectedKeyword || keywords.some(k => k.toLowerCase().includes(selectedKeyword));
-                const specialMatch = !selectedSpecial || special.includes(selectedSpecial);
-                const searchMatch = !searchTerm || title.includes(searchTerm) || description.includes(searchTerm);
-                
-                if (sourceMatch && continentMatch && topicMatch && specialMatch && keywordMatch && searchMatch) {
-                    article.style.display = 'block';
-                } else {
-                    article.style.display = 'none';
-                }
-            });
-        }
+        if not metadata_files:
+            logger.warning("No metadata files found to generate HTML index")
+            return False, []
         
-        sourceFilter.addEventListener('change', filterArticles);
-        continentFilter.addEventListener('change', filterArticles);
-        topicFilter.addEventListener('change', filterArticles);
-        keywordFilter.addEventListener('change', filterArticles);
-        specialFilter.addEventListener('change', filterArticles);
-        searchInput.addEventListener('input', filterArticles);
+        # Skip loading, rendering and uploading when the published index was
+        # built from exactly this listing
+        html_key = f"{S3_FOLDER_NEWS}/index.html"
+        fingerprint = date_index_fingerprint(listing)
+        if not FRESH_MODE:
+            try:
+                head = s3_client.head_object(Bucket=S3_BUCKET_NAME, Key=html_key)
+                if head.get('Metadata', {}).get('fingerprint') == fingerprint:
+                    logger.info(f"{html_key} is up to date with today's metadata, skipping")
+                    S3_MANIFEST.add(html_key)
+                    return True, None
+            except ClientError as e:
+                logger.debug(f"No existing date index to compare: {e}")
+        
+        # Load all metadata (concurrently, skipping files that fail to load)
+        articles = load_metadata_files(metadata_files, fetch=fetch_article_metadata)
+        
+        # Sort articles by publication date (newest first); undated or
+        # unparseable articles sort last
+        def sort_key(article):
+            article_date = article.get('pub_date') or article.get('date') or ''
+            # ISO timestamps already sort as strings: compare their wall-clock
+            # part directly (offsets are ignored, as for parsed dates below)
+            if ISO_DATETIME_RE.match(article_date):
+                return article_date[:19]
+            parsed_date = parse_article_date(article_date)
+            if parsed_date is None:
+                parsed_date = datetime.min
+            # Make timezone-naive for comparison
+            return parsed_date.replace(tzinfo=None).isoformat(timespec='seconds')
         
-        // Initialize
-        filterArticles();
-    </script>
-    </main>
-</body>
-</html>"""
+        articles.sort(key=sort_key, reverse=True)
         
-        # Upload HTML file to S3 (force update for HTML files)
-        html_key = f"{S3_FOLDER_NEWS}/index.html"
+        # Aggregate the header stats and filter options in one pass
+        stats, sources, keywords = aggregate_articles(articles)
+        
+        # Render the page from the precompiled template (autoescaped), streaming
+        # its chunks straight into gzip so the full HTML is never held as one string
+        html_chunks = DATE_INDEX_TEMPLATE.generate(
+            today=today,
+            articles=[date_index_article_view(article) for article in articles],
+            sources=sorted(sources),
+            keyword_options=[(keyword, keyword.title()) for keyword in sorted(keywords)],
+            total_length=stats['total_length']
+        )
+        
+        # Upload HTML file to S3 gzipped, tagged with the listing fingerprint
+        html_body = gzip_chunks(html_chunks)
         try:
             logger.info(f"Uploading to S3: {html_key}")
             s3_client.put_object(
                 Bucket=S3_BUCKET_NAME,
                 Key=html_key,
-                Body=html_content.encode('utf-8'),
-                ContentType="text/html"
+                Body=html_body,
+                ContentType="text/html",
+                ContentEncoding="gzip",
+                CacheControl=INDEX_CACHE_CONTROL,
+                Metadata={'fingerprint': fingerprint}
             )
+            logger.info(f"? Uploaded: {html_key}")
             # Add to manifest
             S3_MANIFEST.add(html_key)
-            logger.info(f"? Uploaded: {html_key}")
             success = True
         except Exception as e:
             logger.error(f"Failed to upload {html_key}: {e}")
@@ -1472,56 +1950,209 @@ def generate_date_html_index():
         
         if success:
             logger.info(f"? Generated date HTML index: s3://{S3_BUCKET_NAME}/{html_key}")
-            return True
+            return True, articles
         else:
             logger.error("Failed to upload date HTML index to S3")
-            return False
+            return False, articles
             
     except Exception as e:
         logger.error(f"Error generating date HTML index: {str(e)}")
-        return False
+        return False, None
+
+# Per-date stats cache for the master index, so unchanged dates are not re-read
+INDEX_STATS_KEY = "index-stats.json"
+INDEX_STATS_TTL = 24 * 60 * 60  # seconds
+
+# The master and date indexes are served gzipped with a short browser cache
+INDEX_CACHE_CONTROL = "public, max-age=300"
+
+# Master index cards live in <main class="content-grid">...</main>
+CONTENT_GRID_OPEN = '<main class="content-grid">'
 
-def generate_master_html_index():
-    """Add today's card to the master HTML index file"""
+def find_content_grid(html_content: str):
+    """Return (start, end) offsets of the content-grid element, or None if absent"""
+    grid_start = html_content.find(CONTENT_GRID_OPEN)
+    if grid_start == -1:
+        return None
+    grid_end = html_content.find('</main>', grid_start)
+    if grid_end == -1:
+        return None
+    return grid_start, grid_end + len('</main>')
+
+def read_html_body(response) -> str:
+    """Decode an HTML get_object body, gunzipping it if it was stored gzipped"""
+    body = response['Body'].read()
+    if response.get('ContentEncoding') == 'gzip':
+        body = gzip.decompress(body)
+    return body.decode('utf-8')
+
+@lru_cache(maxsize=4096)
+def get_metadata_cached(key: str) -> Dict:
+    """Download and parse one metadata JSON object, memoised by key.
+    
+    Metadata objects are written once, so repeated reads within a process (or
+    a warm Lambda container) are served from memory. Errors are not cached.
+    """
+    response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=key)
+    return orjson.loads(response['Body'].read())
+
+def fetch_metadata(key: str) -> Optional[Dict]:
+    """Download and parse one metadata JSON object (None on error)"""
+    try:
+        return get_metadata_cached(key)
+    except Exception as e:
+        logger.debug(f"Error loading metadata {key}: {e}")
+        return None
+
+def fetch_article_metadata(key: str) -> Optional[Dict]:
+    """Metadata for the date index, tagged with the key it was loaded from"""
+    metadata = fetch_metadata(key)
+    if metadata is None:
+        return None
+    # Copy, since the cached dict is shared with other callers
+    return {**metadata, '_metadata_path': key}
+
+def iter_metadata_objects(prefix: str):
+    """Yield the listing entries of metadata JSON files in any subfolder under prefix"""
+    for page in S3_LIST_PAGINATOR.paginate(Bucket=S3_BUCKET_NAME, Prefix=prefix, **S3_LIST_ARGS):
+        for obj in page.get('Contents', ()):
+            key = obj['Key']
+            if key.endswith('.json') and '/metadata/' in key:
+                yield obj
+
+def list_today_metadata_files():
+    """List today's metadata keys (including RSS, direct, and legislation).
+    
+    Returns (keys, last_modified, listing) where last_modified is the newest
+    LastModified timestamp among them (ISO string, None if there are none) and
+    listing holds a (key, size, etag) tuple per file.
+    """
+    metadata_files = []
+    listing = []
+    last_modified = None
+    try:
+        for obj in iter_metadata_objects(f"{S3_FOLDER_NEWS}/"):
+            metadata_files.append(obj['Key'])
+            listing.append((obj['Key'], obj['Size'], obj['ETag']))
+            modified = obj['LastModified'].isoformat()
+            if last_modified is None or modified > last_modified:
+                last_modified = modified
+    except Exception as e:
+        logger.debug(f"Error listing metadata files for {today}: {e}")
+    return metadata_files, last_modified, listing
+
+def load_metadata_files(metadata_files: List[str], fetch=fetch_metadata) -> List[Dict]:
+    """Download metadata objects, skipping any that fail to load"""
+    # GETs are latency-bound, so fetch them concurrently on the shared client
+    with ThreadPoolExecutor(max_workers=S3_MAX_POOL_CONNECTIONS) as executor:
+        results = executor.map(fetch, metadata_files)
+        return [metadata for metadata in results if metadata is not None]
+
+def aggregate_articles(articles: List[Dict]):
+    """Single pass over articles for a date's card stats and page filter options.
+    
+    Returns (stats, sources, keywords). Articles without a source count as
+    'Unknown' in the filter options but not in source_count.
+    """
+    sources = set()
+    keywords = set()
+    total_length = 0
+    unnamed_source = False
+    for article in articles:
+        if 'source' in article:
+            sources.add(article['source'])
+        else:
+            unnamed_source = True
+        total_length += article.get('content_length', 0)
+        keywords.update(article.get('tags', {}).get('matched_keywords', []))
+    
+    stats = {
+        'article_count': len(articles),
+        'total_length': total_length,
+        'source_count': len(sources)
+    }
+    if unnamed_source:
+        sources.add('Unknown')
+    return stats, sources, keywords
+
+def compute_date_stats(articles: List[Dict]) -> Dict:
+    """Aggregate the stats shown on a date's master index card"""
+    return aggregate_articles(articles)[0]
+
+def load_index_stats() -> Dict:
+    """Load the per-date stats cache (empty if missing or unreadable)"""
+    try:
+        response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=INDEX_STATS_KEY)
+        return orjson.loads(response['Body'].read())
+    except Exception as e:
+        logger.debug(f"No index stats cache loaded: {e}")
+        return {}
+
+def save_index_stats(index_stats: Dict):
+    """Persist the per-date stats cache"""
+    try:
+        s3_client.put_object(
+            Bucket=S3_BUCKET_NAME,
+            Key=INDEX_STATS_KEY,
+            Body=orjson.dumps(index_stats, option=orjson.OPT_INDENT_2),
+            ContentType="application/json"
+        )
+    except Exception as e:
+        logger.debug(f"Failed to save index stats cache: {e}")
+
+def get_today_stats() -> Dict:
+    """Today's card stats, reusing the cached entry while today's metadata is unchanged"""
+    metadata_files, last_modified, _ = list_today_metadata_files()
+    index_stats = load_index_stats()
+    
+    cached = index_stats.get(today)
+    if (cached and cached.get('last_seen') == last_modified
+            and time.time() - cached.get('cached_at', 0) < INDEX_STATS_TTL):
+        logger.info(f"Using cached stats for {today}")
+        return cached
+    
+    # The daily manifest covers everything ingested through the scrapers; only
+    # metadata files it does not list yet need to be downloaded
+    manifest = load_daily_manifest(today)
+    entries = [manifest[key] for key in metadata_files if key in manifest]
+    missing = [key for key in metadata_files if key not in manifest]
+    if missing:
+        logger.info(f"{len(missing)} metadata files not in manifest, downloading them")
+        entries.extend(load_metadata_files(missing))
+    
+    stats = compute_date_stats(entries)
+    stats.update(last_seen=last_modified, cached_at=time.time())
+    index_stats[today] = stats
+    save_index_stats(index_stats)
+    return stats
+
+def generate_master_html_index(articles: Optional[List[Dict]] = None):
+    """Add today's card to the master HTML index file.
+
+    If today's article metadata was already loaded (see generate_date_html_index)
+    pass it in to skip re-listing and re-downloading it from S3.
+    """
     logger.info("?? Adding today's card to master HTML index...")
     
     try:
         # Load the existing archive index page
+        current_etag = None
         try:
             response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key="index.html")
-            html_content = response['Body'].read().decode('utf-8')
+            html_content = read_html_body(response)
+            current_etag = response['ETag']
         except:
             # If no existing file, load from local template
             with open('index.html', 'r') as f:
                 html_content = f.read()
         
         # Get today's stats
-        article_count = 0
-        sources = set()
-        
-        # Count articles from today's folder (including RSS, direct, and legislation)
-        try:
-            paginator = s3_client.get_paginator('list_objects_v2')
-            # Count all metadata files from today's folder
-            page_iterator = paginator.paginate(
-                Bucket=S3_BUCKET_NAME,
-                Prefix=f"news/{today}/"
-            )
-            for page in page_iterator:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        # Match any metadata file in any subfolder
-                        if obj['Key'].endswith('.json') and '/metadata/' in obj['Key']:
-                            try:
-                                response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=obj['Key'])
-                                metadata = json.loads(response['Body'].read().decode('utf-8'))
-                                article_count += 1
-                                if 'source' in metadata:
-                                    sources.add(metadata['source'])
-                            except Exception as e:
-                                logger.debug(f"Error loading metadata: {e}")
-        except Exception as e:
-            logger.debug(f"Error counting articles for {today}: {e}")
+        if articles is not None:
+            stats = compute_date_stats(articles)
+        else:
+            stats = get_today_stats()
+        article_count = stats['article_count']
+        source_count = stats['source_count']
         
         # Create today's card HTML using the same structure as blog.html content cards
         today_card = f"""
@@ -1531,7 +2162,7 @@ def generate_master_html_index():
                 </div>
                 <div class="card-content">
                     <h3 class="card-title">Daily News Collection - {today}</h3>
-                    <p class="card-excerpt">Complete collection of {article_count} articles from {len(sources)} sources covering energy, AI, and blockchain topics.</p>
+                    <p class="card-excerpt">Complete collection of {article_count} articles from {source_count} sources covering energy, AI, and blockchain topics.</p>
                     <div class="card-meta">
                         <span class="card-date">{today}</span>
                         <span class="card-read-time">{article_count} articles</span>
@@ -1540,44 +2171,60 @@ def generate_master_html_index():
             </article>
         """
         
-        # Use BeautifulSoup to properly handle HTML manipulation
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Find the content grid
-        content_grid = soup.find('main', class_='content-grid')
-        if content_grid:
+        # Fast path: no card for today yet, so just prepend it after the grid's opening tag
+        grid_bounds = find_content_grid(html_content)
+        if grid_bounds and f'Daily News Collection - {today}' not in html_content:
+            html_content = html_content.replace(CONTENT_GRID_OPEN, CONTENT_GRID_OPEN + today_card, 1)
+            logger.info(f"Added new card for {today}")
+        
+        # Today's card already exists: parse only the content grid to replace it;
+        # the rest of the page is passed through untouched
+        elif grid_bounds:
+            grid_start, grid_end = grid_bounds
+            tree = LexborHTMLParser(html_content[grid_start:grid_end])
+            content_grid = tree.css_first('main.content-grid')
+            
             # Find and remove any existing cards for today
-            existing_cards = content_grid.find_all('article', {'data-type': 'news'})
-            for card in existing_cards:
-                title = card.find('h3', class_='card-title')
-                if title and f'Daily News Collection - {today}' in title.get_text():
+            for card in content_grid.css('article[data-type="news"]'):
+                title = card.css_first('h3.card-title')
+                if title and f'Daily News Collection - {today}' in title.text():
                     logger.info(f"Removing existing card for {today}")
                     card.decompose()
             
             # Parse the new card and add it
-            new_card_soup = BeautifulSoup(today_card, 'html.parser')
-            new_card = new_card_soup.find('article')
+            new_card = LexborHTMLParser(today_card).css_first('article')
             if new_card:
                 # Insert at the beginning of content-grid
-                content_grid.insert(0, new_card)
+                if content_grid.child:
+                    content_grid.child.insert_before(new_card)
+                else:
+                    content_grid.insert_child(new_card)
                 logger.info(f"Added new card for {today}")
+            
+            # Splice the updated grid back into the page
+            html_content = html_content[:grid_start] + content_grid.html + html_content[grid_end:]
+        else:
+            logger.warning("No content grid found in master index, leaving it unchanged")
         
-        # Convert back to HTML string
-        html_content = str(soup)
-        
-        # Upload the updated HTML file to S3
+        # Upload the updated HTML file to S3 (mtime=0 keeps the gzip bytes, and
+        # so the ETag, stable for identical HTML)
+        html_body = gzip.compress(html_content.encode('utf-8'), compresslevel=6, mtime=0)
         try:
-            logger.info(f"Uploading to S3: index.html")
-            s3_client.put_object(
-                Bucket=S3_BUCKET_NAME,
-                Key="index.html",
-                Body=html_content.encode('utf-8'),
-                ContentType="text/html"
-            )
+            if current_etag and s3_body_unchanged("index.html", html_body, current_etag):
+                logger.info("index.html unchanged, skipping upload")
+            else:
+                logger.info(f"Uploading to S3: index.html")
+                s3_client.put_object(
+                    Bucket=S3_BUCKET_NAME,
+                    Key="index.html",
+                    Body=html_body,
+                    ContentType="text/html",
+                    ContentEncoding="gzip",
+                    CacheControl=INDEX_CACHE_CONTROL
+                )
+                logger.info(f"? Uploaded: index.html")
             # Add to manifest
             S3_MANIFEST.add("index.html")
-            logger.info(f"? Uploaded: index.html")
             success = True
         except Exception as e:
             logger.error(f"Failed to upload index.html: {e}")
@@ -1593,392 +2240,6 @@ def generate_master_html_index():
     except Exception as e:
         logger.error(f"Error updating master HTML index: {str(e)}")
         return False
-        
-        try:
-            paginator = s3_client.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(
-                Bucket=S3_BUCKET_NAME,
-                Prefix="news/"
-            )
-            
-            for page in page_iterator:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        if obj['Key'].endswith('/index.html') and 'news/' in obj['Key']:
-                            # Extract date from path like "news/2025-10-09/index.html"
-                            path_parts = obj['Key'].split('/')
-                            if len(path_parts) >= 3:
-                                date_folder = path_parts[1]  # e.g., "2025-10-09"
-                                if date_folder not in date_folders:
-                                    date_folders.append(date_folder)
-        except Exception as e:
-            logger.debug(f"Error listing date folders: {e}")
-        
-        # Sort dates (newest first)
-        date_folders.sort(reverse=True)
-        
-        if not date_folders:
-            logger.warning("No date folders found to generate master index")
-            return False
-        
-        # Get statistics for each date
-        date_stats = []
-        for date_folder in date_folders:
-            try:
-                # Count articles in this date folder
-                article_count = 0
-                total_length = 0
-                sources = set()
-                
-                # Count RSS articles
-                try:
-                    page_iterator = paginator.paginate(
-                        Bucket=S3_BUCKET_NAME,
-                        Prefix=f"news/{date_folder}/rss/metadata/"
-                    )
-                    
-                    for page in page_iterator:
-                        if 'Contents' in page:
-                            for obj in page['Contents']:
-                                if obj['Key'].endswith('.json'):
-                                    article_count += 1
-                                    # Load metadata to get stats
-                                    try:
-                                        response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=obj['Key'])
-                                        metadata = json.loads(response['Body'].read().decode('utf-8'))
-                                        total_length += metadata.get('content_length', 0)
-                                        sources.add(metadata.get('source', 'Unknown'))
-                                    except:
-                                        pass
-                except:
-                    pass
-                
-                # Count direct scraping articles
-                try:
-                    page_iterator = paginator.paginate(
-                        Bucket=S3_BUCKET_NAME,
-                        Prefix=f"news/{date_folder}/direct/metadata/"
-                    )
-                    
-                    for page in page_iterator:
-                        if 'Contents' in page:
-                            for obj in page['Contents']:
-                                if obj['Key'].endswith('.json'):
-                                    article_count += 1
-                                    # Load metadata to get stats
-                                    try:
-                                        response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=obj['Key'])
-                                        metadata = json.loads(response['Body'].read().decode('utf-8'))
-                                        total_length += metadata.get('content_length', 0)
-                                        sources.add(metadata.get('source', 'Unknown'))
-                                    except:
-                                        pass
-                except:
-                    pass
-                
-                date_stats.append({
-                    'date': date_folder,
-                    'article_count': article_count,
-                    'total_length': total_length,
-                    'source_count': len(sources)
-                })
-                
-            except Exception as e:
-                logger.debug(f"Error getting stats for {date_folder}: {e}")
-                date_stats.append({
-                    'date': date_folder,
-                    'article_count': 0,
-                    'total_length': 0,
-                    'source_count': 0
-                })
-        
-        # Generate HTML content
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>News Collection Archive</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 3em;
-            font-weight: 300;
-        }}
-        .header p {{
-            margin: 15px 0 0 0;
-            opacity: 0.9;
-            font-size: 1.2em;
-        }}
-        .overview {{
-            display: flex;
-            justify-content: center;
-            gap: 40px;
-            margin-top: 30px;
-        }}
-        .overview-stat {{
-            text-align: center;
-        }}
-        .overview-number {{
-            font-size: 2.5em;
-            font-weight: bold;
-            display: block;
-        }}
-        .overview-label {{
-            font-size: 1em;
-            opacity: 0.8;
-        }}
-        .content {{
-            padding: 40px;
-        }}
-        .date-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            margin-top: 30px;
-        }}
-        .date-card {{
-            border: 1px solid #eee;
-            border-radius: 8px;
-            padding: 20px;
-            transition: all 0.2s;
-            background: white;
-        }}
-        .date-card:hover {{
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            transform: translateY(-2px);
-        }}
-        .date-card h3 {{
-            margin: 0 0 15px 0;
-            color: #333;
-            font-size: 1.3em;
-        }}
-        .date-card a {{
-            color: #667eea;
-            text-decoration: none;
-            font-weight: 600;
-        }}
-        .date-card a:hover {{
-            text-decoration: underline;
-        }}
-        .date-stats {{
-            display: flex;
-            gap: 15px;
-            margin-bottom: 15px;
-            font-size: 0.9em;
-            color: #666;
-        }}
-        .date-stat {{
-            background: #f8f9fa;
-            padding: 4px 8px;
-            border-radius: 4px;
-        }}
-        .date-description {{
-            color: #555;
-            font-size: 0.9em;
-            margin-bottom: 15px;
-        }}
-        .view-button {{
-            display: inline-block;
-            background: #667eea;
-            color: white;
-            padding: 10px 20px;
-            text-decoration: none;
-            border-radius: 4px;
-            font-size: 0.9em;
-            transition: background-color 0.2s;
-        }}
-        .view-button:hover {{
-            background: #5a6fd8;
-        }}
-        .search-section {{
-            margin-bottom: 30px;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 6px;
-        }}
-        .search-group {{
-            display: flex;
-            gap: 15px;
-            align-items: center;
-            flex-wrap: wrap;
-        }}
-        .search-group input {{
-            padding: 10px 15px;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            font-size: 1em;
-            flex: 1;
-            min-width: 200px;
-        }}
-        .no-dates {{
-            text-align: center;
-            padding: 60px 20px;
-            color: #666;
-        }}
-        .no-dates h3 {{
-            margin: 0 0 10px 0;
-            font-size: 1.5em;
-        }}
-        @media (max-width: 768px) {{
-            .overview {{
-                flex-direction: column;
-                gap: 20px;
-            }}
-            .date-grid {{
-                grid-template-columns: 1fr;
-            }}
-            .search-group {{
-                flex-direction: column;
-                align-items: stretch;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>?? News Collection Archive</h1>
-            <p>Energy, AI, and Blockchain News Collection</p>
-            <div class="overview">
-                <div class="overview-stat">
-                    <span class="overview-number">{len(date_folders)}</span>
-                    <span class="overview-label">Collection Dates</span>
-                </div>
-                <div class="overview-stat">
-                    <span class="overview-number">{sum(stat['article_count'] for stat in date_stats)}</span>
-                    <span class="overview-label">Total Articles</span>
-                </div>
-                <div class="overview-stat">
-                    <span class="overview-number">{sum(stat['total_length'] for stat in date_stats) // 1000}K</span>
-                    <span class="overview-label">Total Words</span>
-                </div>
-            </div>
-        </div>
-        
-        <div class="content">
-            <div class="search-section">
-                <div class="search-group">
-                    <input type="text" id="searchInput" placeholder="Search collection dates...">
-                </div>
-            </div>
-            
-            <div id="datesList" class="date-grid">"""
-        
-        # Add date cards
-        for stat in date_stats:
-            date_str = stat['date']
-            article_count = stat['article_count']
-            total_length = stat['total_length']
-            source_count = stat['source_count']
-            
-            # Format date for display
-            try:
-                from dateutil import parser
-                parsed_date = parser.parse(date_str)
-                formatted_date = parsed_date.strftime('%B %d, %Y')
-            except:
-                formatted_date = date_str
-            
-            html_content += f"""
-                <div class="date-card" data-date="{date_str}" data-articles="{article_count}">
-                    <h3><a href="news/{date_str}/index.html">{formatted_date}</a></h3>
-                    <div class="date-stats">
-                        <span class="date-stat">{article_count} articles</span>
-                        <span class="date-stat">{source_count} sources</span>
-                        <span class="date-stat">{total_length // 1000}K words</span>
-                    </div>
-                    <div class="date-description">
-                        Collection of energy, AI, and blockchain news from {formatted_date}
-                    </div>
-                    <a href="news/{date_str}/index.html" class="view-button">View Collection <i class="fas fa-arrow-right"></i></a>
-                </div>"""
-        
-        html_content += """
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        // Search functionality
-        const searchInput = document.getElementById('searchInput');
-        const datesList = document.getElementById('datesList');
-        const dateCards = document.querySelectorAll('.date-card');
-        
-        function filterDates() {
-            const searchTerm = searchInput.value.toLowerCase();
-            
-            dateCards.forEach(card => {
-                const date = card.dataset.date;
-                const articles = card.dataset.articles;
-                
-                const dateMatch = date.includes(searchTerm);
-                const articleMatch = articles.includes(searchTerm);
-                
-                if (dateMatch || articleMatch) {
-                    card.style.display = 'block';
-                } else {
-                    card.style.display = 'none';
-                }
-            });
-        }
-        
-        searchInput.addEventListener('input', filterDates);
-        
-        // Initialize
-        filterDates();
-    </script>
-</body>
-</html>"""
-        
-        # Upload master HTML file to S3 root (force update for HTML files)
-        try:
-            logger.info(f"Uploading to S3: index.html")
-            s3_client.put_object(
-                Bucket=S3_BUCKET_NAME,
-                Key="index.html",
-                Body=html_content.encode('utf-8'),
-                ContentType="text/html"
-            )
-            # Add to manifest
-            S3_MANIFEST.add("index.html")
-            logger.info(f"? Uploaded: index.html")
-            success = True
-        except Exception as e:
-            logger.error(f"Failed to upload index.html: {e}")
-            success = False
-        
-        if success:
-            logger.info(f"? Generated master HTML index: s3://{S3_BUCKET_NAME}/index.html")
-            return True
-        else:
-            logger.error("Failed to upload master HTML index to S3")
-            return False
-            
-    except Exception as e:
-        logger.error(f"Error generating master HTML index: {str(e)}")
-        return False
 
 # -------------------------------------------------------------------------
 # MAIN EXECUTION
@@ -1997,6 +2258,8 @@ def main():
             "total_articles": 0,
             "last_updated": None
         }
+        # Fresh runs overwrite metadata, so drop anything memoised by a warm container
+        get_metadata_cached.cache_clear()
     else:
         logger.info("?? IDEMPOTENT MODE: Skipping already processed articles")
     
@@ -2016,13 +2279,16 @@ def main():
         logger.info("\n?? Phase 2: Direct website scraping...")
         process_direct_scraping()
         
+        # Record this run's articles in the daily manifest
+        flush_daily_manifest(today)
+        
         # Phase 3: Generate date HTML index
         logger.info("\n?? Phase 3: Generating date HTML index...")
-        generate_date_html_index()
+        _, today_articles = generate_date_html_index()
         
-        # Phase 4: Generate master HTML index
+        # Phase 4: Generate master HTML index (reuses the metadata loaded in phase 3)
         logger.info("\n?? Phase 4: Generating master HTML index...")
-        generate_master_html_index()
+        generate_master_html_index(today_articles)
         
     except KeyboardInterrupt:
         logger.info("\n?? Collection interrupted by user")
@@ -2031,6 +2297,8 @@ def main():
         logger.error(f"\n? Fatal error: {str(e)}")
         raise
     finally:
+        progress_tracker.flush()
+        prune_http_cache()
         elapsed = time.time() - start_time
         logger.info(f"\n?? News collection session complete!")
         logger.info(f"?? Total time: {elapsed/60:.1f} minutes")
@@ -7,9 +7,15 @@ news_scraper.py (filtered content) and legislation_scraper.py (all legislation).
 """
 
 import os
-import json
+import gzip
 import boto3
+import orjson
 import hashlib
+import threading
+import xxhash
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from datetime import datetime
 from typing import Dict, List, Optional
 import logging
@@ -18,11 +24,40 @@ logger = logging.getLogger("news_storage")
 
 # S3 Configuration - shared across all scrapers
 S3_BUCKET_NAME = "news-collection-website"
-s3_client = boto3.client('s3')
+# One client for the whole process, sized for the thread pools that share it
+# (news_scraper's metadata loads use a full pool; uploads and article workers
+# share the rest)
+S3_MAX_POOL_CONNECTIONS = 64
+s3_client = boto3.client("s3", region_name="us-east-1",
+                         config=Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                                       tcp_keepalive=True,
+                                       retries={'max_attempts': 3, 'mode': 'adaptive'}))
+
+# Article HTML is stored gzipped; S3 serves it with Content-Encoding: gzip so
+# browsers following the index links decompress it transparently
+CONTENT_GZIP_LEVEL = 6
 
 # Track uploaded files in memory (faster than repeated HEAD requests)
 S3_MANIFEST = set()
 
+# Per-day manifest of ingested articles (one JSON object per line), so index
+# generation can read one object instead of every metadata file
+DAILY_MANIFEST_NAME = "manifest.jsonl"
+# Concurrent scrapers rewrite the manifest with conditional PUTs; a writer
+# that loses the race re-reads it and tries again this many times
+MANIFEST_WRITE_ATTEMPTS = 5
+_pending_manifest_entries = []
+_manifest_lock = threading.Lock()
+
+def url_hash(url: str) -> str:
+    """Article ID for a URL (also the metadata/content file name)"""
+    # x_ marks xxh128 IDs; articles stored before the switch use plain md5
+    return "x_" + xxhash.xxh128_hexdigest(url.encode())
+
+def legacy_url_hash(url: str) -> str:
+    """md5 article ID used for articles stored before url_hash moved to xxh128"""
+    return hashlib.md5(url.encode()).hexdigest()
+
 def get_today_folder() -> str:
     """Get today's folder path for storing articles"""
     today = datetime.now().strftime("%Y-%m-%d")
@@ -55,6 +90,33 @@ def exists_in_s3(s3_key: str) -> bool:
         logger.error(f"Error checking S3 existence for {s3_key}: {e}")
         return False
 
+def put_object_if_absent(**put_kwargs) -> bool:
+    """
+    PUT an object only if its key does not exist yet, in a single request.
+    
+    Uses S3 conditional writes (IfNoneMatch='*'). Returns False when the key
+    already exists. Endpoints without conditional-write support fall back to
+    a HEAD probe followed by a plain PUT.
+    """
+    try:
+        s3_client.put_object(IfNoneMatch='*', **put_kwargs)
+        return True
+    except ClientError as e:
+        error_code = e.response.get('Error', {}).get('Code')
+        if error_code in ('PreconditionFailed', '412', 'ConditionalRequestConflict'):
+            return False
+        if error_code not in ('NotImplemented', '501'):
+            raise
+    
+    try:
+        s3_client.head_object(Bucket=put_kwargs['Bucket'], Key=put_kwargs['Key'])
+        return False
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') not in ('404', 'NoSuchKey', 'NotFound'):
+            raise
+    s3_client.put_object(**put_kwargs)
+    return True
+
 def upload_to_s3_if_not_exists(file_content: bytes, s3_key: str, content_type: str = "text/html") -> bool:
     """
     Upload file to S3 if it doesn't already exist.
@@ -62,19 +124,22 @@ def upload_to_s3_if_not_exists(file_content: bytes, s3_key: str, content_type: s
     """
     s3_key = sanitize_filename(s3_key)
     
-    # Check manifest first (faster than HEAD request)
-    if exists_in_s3(s3_key):
+    # Check manifest first (no request needed)
+    if s3_key in S3_MANIFEST:
         logger.debug(f"Skipping (exists): {s3_key}")
         return False
     
     try:
         logger.info(f"Uploading to S3: {s3_key}")
-        s3_client.put_object(
+        if not put_object_if_absent(
             Bucket=S3_BUCKET_NAME,
             Key=s3_key,
             Body=file_content,
             ContentType=content_type
-        )
+        ):
+            S3_MANIFEST.add(s3_key)
+            logger.debug(f"Skipping (exists): {s3_key}")
+            return False
         # Add to manifest
         S3_MANIFEST.add(s3_key)
         logger.info(f"✓ Uploaded: {s3_key}")
@@ -83,6 +148,30 @@ def upload_to_s3_if_not_exists(file_content: bytes, s3_key: str, content_type: s
         logger.error(f"Failed to upload {s3_key}: {e}")
         return False
 
+def upload_article_content(full_content: str, content_key: str) -> bool:
+    """
+    Upload an article's content HTML, gzipped. Every scraper stores content
+    through here so all content objects share one encoding.
+    
+    Overwrites any existing object, so re-running an interrupted save (or a
+    content refresh) completes it. Returns True if uploaded.
+    """
+    content_key = sanitize_filename(content_key)
+    try:
+        logger.info(f"Uploading to S3: {content_key}")
+        s3_client.put_object(
+            Bucket=S3_BUCKET_NAME,
+            Key=content_key,
+            Body=gzip.compress(full_content.encode('utf-8'), compresslevel=CONTENT_GZIP_LEVEL, mtime=0),
+            ContentType="text/html",
+            ContentEncoding="gzip"
+        )
+        S3_MANIFEST.add(content_key)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to upload {content_key}: {e}")
+        return False
+
 def save_article(
     title: str,
     url: str,
@@ -109,10 +198,10 @@ def save_article(
         folder_prefix: Optional folder prefix (e.g., "legislation" to separate from regular news)
     
     Returns:
-        Article ID (MD5 hash of URL) if saved, None if already exists
+        Article ID (url_hash of URL) if saved, None if already exists
     """
     # Generate unique ID from URL
-    article_id = hashlib.md5(url.encode()).hexdigest()
+    article_id = url_hash(url)
     
     # Determine folder structure
     today_folder = get_today_folder()
@@ -138,27 +227,138 @@ def save_article(
     metadata_key = f"{base_folder}/metadata/{article_id}.json"
     content_key = f"{base_folder}/content/{article_id}.html"
     
-    # Check if already exists
-    if exists_in_s3(metadata_key) and exists_in_s3(content_key):
-        logger.debug(f"Article already exists: {article_id}")
-        return None
-    
-    # Save metadata
-    if upload_to_s3_if_not_exists(
-        json.dumps(metadata, indent=2).encode("utf-8"),
+    # Save full content first: the metadata marks the article as processed,
+    # so it is only written once the content is stored. The conditional
+    # metadata PUT still keeps a concurrent save from recording it twice.
+    if upload_article_content(full_content, content_key) and upload_to_s3_if_not_exists(
+        orjson.dumps(metadata, option=orjson.OPT_INDENT_2),
         metadata_key,
         "application/json"
     ):
-        # Save full content
-        if upload_to_s3_if_not_exists(
-            full_content.encode('utf-8'),
-            content_key
-        ):
-            logger.info(f"✓ Saved article: {title[:50]}...")
-            return article_id
+        record_manifest_entry(metadata_key, metadata)
+        logger.info(f"✓ Saved article: {title[:50]}...")
+        return article_id
     
     return None
 
+def record_manifest_entry(metadata_key: str, metadata: Dict):
+    """Queue an ingested article for the daily manifest (see flush_daily_manifest)"""
+    entry = {
+        'key': metadata_key,
+        'content_length': metadata.get('content_length', 0)
+    }
+    # Left out when unnamed, as in the metadata: aggregate_articles does not
+    # count a missing source towards source_count
+    if 'source' in metadata:
+        entry['source'] = metadata['source']
+    if 'content_simhash' in metadata:
+        entry['simhash'] = metadata['content_simhash']
+    with _manifest_lock:
+        _pending_manifest_entries.append(entry)
+
+def flush_daily_manifest(date_str: Optional[str] = None) -> int:
+    """
+    Append queued manifest entries to news/<date>/manifest.jsonl.
+    
+    S3 objects cannot be appended to, so the existing manifest is read and
+    rewritten with the new lines added (see append_manifest_lines). Returns
+    the number of entries written.
+    """
+    with _manifest_lock:
+        entries = list(_pending_manifest_entries)
+        _pending_manifest_entries.clear()
+    if not entries:
+        return 0
+    
+    if not date_str:
+        date_str = datetime.now().strftime("%Y-%m-%d")
+    manifest_key = f"news/{date_str}/{DAILY_MANIFEST_NAME}"
+    
+    lines = b''.join(orjson.dumps(entry) + b'\n' for entry in entries)
+    try:
+        for _ in range(MANIFEST_WRITE_ATTEMPTS):
+            if append_manifest_lines(manifest_key, lines):
+                logger.info(f"✓ Added {len(entries)} entries to {manifest_key}")
+                return len(entries)
+            logger.debug(f"{manifest_key} changed while updating it, retrying")
+        raise RuntimeError(f"still changing after {MANIFEST_WRITE_ATTEMPTS} attempts")
+    except Exception as e:
+        logger.error(f"Failed to update {manifest_key}: {e}")
+        # Keep the entries so a later flush can retry
+        with _manifest_lock:
+            _pending_manifest_entries.extend(entries)
+        return 0
+
+def append_manifest_lines(manifest_key: str, lines: bytes) -> bool:
+    """
+    Rewrite manifest_key with lines appended, unless it changed since it was read.
+    
+    The PUT is conditional on the ETag that was read (or on the key still not
+    existing), so another scraper's concurrent flush is never overwritten.
+    Returns False when that condition fails and the caller should re-read.
+    """
+    try:
+        response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=manifest_key)
+        existing = response['Body'].read()
+        condition = {'IfMatch': response['ETag']}
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') not in ('404', 'NoSuchKey', 'NotFound'):
+            raise
+        existing = b''
+        condition = {'IfNoneMatch': '*'}
+    if existing and not existing.endswith(b'\n'):
+        existing += b'\n'
+    
+    try:
+        s3_client.put_object(
+            Bucket=S3_BUCKET_NAME,
+            Key=manifest_key,
+            Body=existing + lines,
+            ContentType="application/x-ndjson",
+            **condition
+        )
+        return True
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('PreconditionFailed', '412', 'ConditionalRequestConflict'):
+            return False
+        raise
+
+def load_daily_manifest(date_str: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Load news/<date>/manifest.jsonl as a dict keyed by metadata key.
+    
+    Returns an empty dict if the manifest does not exist.
+    """
+    if not date_str:
+        date_str = datetime.now().strftime("%Y-%m-%d")
+    manifest_key = f"news/{date_str}/{DAILY_MANIFEST_NAME}"
+    
+    try:
+        response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=manifest_key)
+        body = response['Body'].read()
+    except Exception as e:
+        logger.debug(f"No manifest loaded for {date_str}: {e}")
+        return {}
+    
+    manifest = {}
+    for line in body.splitlines():
+        if line.strip():
+            entry = orjson.loads(line)
+            manifest[entry['key']] = entry
+    return manifest
+
+# Concurrent metadata GETs, one per connection in the shared client's pool
+METADATA_FETCH_WORKERS = S3_MAX_POOL_CONNECTIONS
+
+def read_metadata(key: str) -> Optional[Dict]:
+    """Download and parse one metadata object (None if it can't be read)"""
+    try:
+        response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=key)
+        return orjson.loads(response['Body'].read())
+    except Exception as e:
+        logger.error(f"Error reading metadata {key}: {e}")
+        return None
+
 def get_all_articles_for_date(date_str: Optional[str] = None) -> List[Dict]:
     """
     Retrieve all article metadata for a given date (or today if not specified).
@@ -183,22 +383,18 @@ def get_all_articles_for_date(date_str: Optional[str] = None) -> List[Dict]:
             Prefix=f"{folder}/"
         )
         
-        for page in pages:
-            if 'Contents' not in page:
-                continue
-            
-            for obj in page['Contents']:
-                if obj['Key'].endswith('.json') and '/metadata/' in obj['Key']:
-                    try:
-                        response = s3_client.get_object(
-                            Bucket=S3_BUCKET_NAME,
-                            Key=obj['Key']
-                        )
-                        metadata = json.loads(response['Body'].read())
-                        articles.append(metadata)
-                    except Exception as e:
-                        logger.error(f"Error reading metadata {obj['Key']}: {e}")
-                        continue
+        metadata_keys = [
+            obj['Key']
+            for page in pages
+            for obj in page.get('Contents', [])
+            if obj['Key'].endswith('.json') and '/metadata/' in obj['Key']
+        ]
+        
+        # GETs are latency-bound, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=METADATA_FETCH_WORKERS) as executor:
+            for metadata in executor.map(read_metadata, metadata_keys):
+                if metadata is not None:
+                    articles.append(metadata)
         
     except Exception as e:
         logger.error(f"Error retrieving articles for {date_str}: {e}")
@@ -51,6 +51,11 @@ POLITICAL_KEYWORDS = [
     "putin", "zelensky", "xi jinping", "netanyahu", "eu ", "european union"
 ]
 
+# All political keywords folded into one alternation, scanned in a single pass
+POLITICAL_KEYWORDS_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(keyword.lower()) for keyword in POLITICAL_KEYWORDS) + r')\b'
+)
+
 # Country detection patterns (full names)
 COUNTRY_PATTERNS = {
     "United States": [
@@ -204,11 +209,7 @@ def is_political_market(market: Dict) -> bool:
     description = (market.get("description") or "").lower()
     combined = question + " " + description
 
-    for keyword in POLITICAL_KEYWORDS:
-        if re.search(r'\b' + re.escape(keyword.lower()) + r'\b', combined):
-            return True
-
-    return False
+    return POLITICAL_KEYWORDS_RE.search(combined) is not None
 
 # -------------------------------------------------------------------------
 # API FETCHING
@@ -74,6 +74,7 @@ cp lambda/lambda_news_scraper.py lambda_package/
 cp lambda/lambda_wrapper.py lambda_package/
 cp news_scraper.py lambda_package/
 cp news_storage.py lambda_package/
+cp news_fetch.py lambda_package/
 cp legislation_scraper.py lambda_package/
 cp polymarket_scraper.py lambda_package/
 cp article_tagger.py lambda_package/
@@ -0,0 +1,35 @@
+"""
+Shared pytest setup: puts the repository root on sys.path and provides the
+scraper modules as fixtures, imported without touching argv or S3.
+"""
+
+import os
+import sys
+import importlib
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+def import_scraper(name: str):
+    """Import a scraper module the way tests need it.
+
+    news_scraper parses sys.argv unless it runs under Lambda, and lists S3 at
+    import; keep both away from the test run.
+    """
+    os.environ.setdefault('AWS_LAMBDA_FUNCTION_NAME', 'test')
+    with mock.patch('boto3.client'):
+        return importlib.import_module(name)
+
+@pytest.fixture(scope='session')
+def news_scraper():
+    return import_scraper('news_scraper')
+
+@pytest.fixture(scope='session')
+def legislation_scraper():
+    return import_scraper('legislation_scraper')
+
+@pytest.fixture(scope='session')
+def news_storage():
+    return import_scraper('news_storage')
@@ -0,0 +1,55 @@
+"""
+Daily Manifest Tests
+Stubs S3 and checks that news_storage.flush_daily_manifest appends with a
+conditional PUT, and re-reads and retries when another writer updated the
+manifest in between instead of overwriting its entries.
+"""
+
+import io
+from unittest import mock
+
+import boto3
+import orjson
+import pytest
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+
+KEY = 'news/2025-01-01/manifest.jsonl'
+
+@pytest.fixture
+def s3(news_storage):
+    client = boto3.client('s3', region_name='us-east-1',
+                          aws_access_key_id='test', aws_secret_access_key='test')
+    with mock.patch.object(news_storage, 's3_client', client), Stubber(client) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+def manifest_body(*keys: str) -> bytes:
+    return b''.join(orjson.dumps({'key': key, 'content_length': 1}) + b'\n' for key in keys)
+
+def stub_get(s3, body: bytes, etag: str):
+    s3.add_response('get_object',
+                    {'Body': StreamingBody(io.BytesIO(body), len(body)), 'ETag': etag},
+                    {'Bucket': 'news-collection-website', 'Key': KEY})
+
+def stub_put(s3, body: bytes, **condition):
+    s3.add_response('put_object', {},
+                    {'Bucket': 'news-collection-website', 'Key': KEY, 'Body': body,
+                     'ContentType': 'application/x-ndjson', **condition})
+
+def test_missing_manifest_is_created_only_if_still_absent(news_storage, s3):
+    s3.add_client_error('get_object', 'NoSuchKey', http_status_code=404)
+    stub_put(s3, manifest_body('a'), IfNoneMatch='*')
+
+    news_storage.record_manifest_entry('a', {'content_length': 1})
+    assert news_storage.flush_daily_manifest('2025-01-01') == 1
+
+def test_concurrent_update_is_reread_not_overwritten(news_storage, s3):
+    stub_get(s3, manifest_body('a'), '"v1"')
+    s3.add_client_error('put_object', 'PreconditionFailed', http_status_code=412)
+    # Another scraper appended 'b' in between
+    stub_get(s3, manifest_body('a', 'b'), '"v2"')
+    stub_put(s3, manifest_body('a', 'b', 'c'), IfMatch='"v2"')
+
+    news_storage.record_manifest_entry('c', {'content_length': 1})
+    assert news_storage.flush_daily_manifest('2025-01-01') == 1
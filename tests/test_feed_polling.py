@@ -0,0 +1,99 @@
+"""
+Feed Polling Tests
+Serves a feed from a local HTTP server and checks that news_scraper
+re-polls completed feeds with the validators saved by an earlier poll, and
+that a 304 answer skips parsing the feed.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+
+ETAG = '"feed-v1"'
+FEED = b'<rss><channel><item><title>t</title><link>http://example.com/a</link></item></channel></rss>'
+
+# If-None-Match header of each request, in arrival order
+seen_validators = []
+
+class FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        seen_validators.append(self.headers.get('If-None-Match'))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('Content-Length', str(len(FEED)))
+        self.send_header('ETag', ETAG)
+        self.end_headers()
+        self.wfile.write(FEED)
+
+    def log_message(self, *args):
+        pass
+
+def start_server() -> str:
+    """Serve FEED on a free local port; returns the feed URL"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f'http://127.0.0.1:{server.server_address[1]}/feed.xml'
+
+FEED_URL = start_server()
+
+@pytest.fixture(autouse=True)
+def idempotent_mode(news_scraper):
+    # Other test modules may set FRESH_MODE before news_scraper is imported
+    with mock.patch.object(news_scraper, 'FRESH_MODE', False):
+        yield
+
+def new_tracker(news_scraper, tmp_path):
+    return news_scraper.ProgressTracker(progress_file=str(tmp_path / 'progress.json'),
+                                        validators_file=str(tmp_path / 'validators.json'))
+
+def test_completed_feed_is_repolled_and_304_skips_parse(news_scraper, tmp_path):
+    tracker = new_tracker(news_scraper, tmp_path)
+    tracker.set_feed_validators(FEED_URL, ETAG, None)
+    tracker.mark_feed_complete(FEED_URL)
+    seen_validators.clear()
+
+    with mock.patch.object(news_scraper, 'progress_tracker', tracker), \
+         mock.patch.object(news_scraper, 'parse_feed_items') as parse:
+        assert news_scraper.process_single_rss_feed(FEED_URL) == 0
+
+    assert seen_validators == [ETAG]
+    parse.assert_not_called()
+
+def test_completed_feed_without_validators_is_not_repolled(news_scraper, tmp_path):
+    tracker = new_tracker(news_scraper, tmp_path)
+    tracker.mark_feed_complete(FEED_URL)
+    seen_validators.clear()
+
+    with mock.patch.object(news_scraper, 'progress_tracker', tracker):
+        assert news_scraper.process_single_rss_feed(FEED_URL) == 0
+
+    assert seen_validators == []
+
+def test_validators_survive_progress_reset(news_scraper, tmp_path):
+    tracker = new_tracker(news_scraper, tmp_path)
+    seen_validators.clear()
+
+    with mock.patch.object(news_scraper, 'progress_tracker', tracker), \
+         mock.patch.object(news_scraper, 'parse_feed_items', return_value=[]) as parse:
+        news_scraper.process_single_rss_feed(FEED_URL)
+    tracker.flush()
+    parse.assert_called_once()
+
+    # A new run whose progress file was cleared still sends the saved ETag
+    (tmp_path / 'progress.json').unlink()
+    tracker = new_tracker(news_scraper, tmp_path)
+    assert not tracker.is_feed_complete(FEED_URL)
+
+    with mock.patch.object(news_scraper, 'progress_tracker', tracker), \
+         mock.patch.object(news_scraper, 'parse_feed_items') as parse:
+        news_scraper.process_single_rss_feed(FEED_URL)
+
+    assert seen_validators == [None, ETAG]
+    parse.assert_not_called()
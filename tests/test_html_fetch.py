@@ -0,0 +1,117 @@
+"""
+HTML Fetch Encoding Tests
+Serves pages from a local HTTP server and checks that news_scraper's
+fetch_html_tree and legislation_scraper's fetch_html decode them like
+BeautifulSoup did: by the Content-Type charset, then <meta charset>,
+then UTF-8 when the bytes are valid UTF-8.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TEXT = 'Café – naïve “quotes”'
+
+# path -> (Content-Type header, body bytes)
+PAGES = {
+    '/utf8-no-meta': ('text/html',
+                      f'<html><body><p>{TEXT}</p></body></html>'.encode('utf-8')),
+    '/utf8-header': ('text/html; charset=utf-8',
+                     f'<html><body><p>{TEXT}</p></body></html>'.encode('utf-8')),
+    '/cp1252-meta': ('text/html',
+                     f'<html><head><meta charset="windows-1252"></head><body><p>{TEXT}</p></body></html>'.encode('cp1252')),
+    '/cp1252-header': ('text/html; charset=windows-1252',
+                       f'<html><body><p>{TEXT}</p></body></html>'.encode('cp1252')),
+    '/cp1252-undeclared': ('text/html',
+                           f'<html><body><p>{TEXT}</p></body></html>'.encode('cp1252')),
+}
+
+# Pages the response cache may keep: path -> (Content-Type header, body bytes)
+LARGE_BODY = b'<html><body><p>start</p>' + b'<p>filler</p>' * (3 * 1024 * 1024 // 13) + b'</body></html>'
+CACHEABLE_PAGES = {
+    '/cacheable-small': ('text/html; charset=utf-8',
+                         f'<html><body><p>{TEXT}</p></body></html>'.encode('utf-8')),
+    '/cacheable-large': ('text/html; charset=utf-8', LARGE_BODY),
+    '/cacheable-pdf': ('application/pdf', b'%PDF-1.4' + b'\0' * (3 * 1024 * 1024)),
+}
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path in CACHEABLE_PAGES:
+            content_type, body = CACHEABLE_PAGES[self.path]
+            cache_control = 'max-age=3600'
+        else:
+            content_type, body = PAGES[self.path]
+            cache_control = 'no-store'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', cache_control)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except ConnectionError:
+            pass  # the client stopped reading early
+
+    def log_message(self, *args):
+        pass
+
+def start_server() -> str:
+    """Serve PAGES on a free local port; returns the base URL"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f'http://127.0.0.1:{server.server_address[1]}'
+
+BASE_URL = start_server()
+
+def fetched_text(news_scraper, path: str) -> str:
+    root = news_scraper.fetch_html_tree(BASE_URL + path)
+    return news_scraper.element_text(root.find('.//p'))
+
+def test_utf8_page_without_meta_charset(news_scraper):
+    assert fetched_text(news_scraper, '/utf8-no-meta') == TEXT
+
+def test_utf8_page_with_header_charset(news_scraper):
+    assert fetched_text(news_scraper, '/utf8-header') == TEXT
+
+def test_windows_1252_page_with_meta_charset(news_scraper):
+    assert fetched_text(news_scraper, '/cp1252-meta') == TEXT
+
+def test_windows_1252_page_with_header_charset(news_scraper):
+    assert fetched_text(news_scraper, '/cp1252-header') == TEXT
+
+def test_undeclared_non_utf8_page_falls_back_to_parser_default(news_scraper):
+    # Not valid UTF-8 and nothing declared: libxml2 reads it as Latin-1, which
+    # only differs from windows-1252 in the 0x80-0x9F punctuation
+    assert fetched_text(news_scraper, '/cp1252-undeclared').startswith('Café')
+
+def is_cached(news_scraper, path: str) -> bool:
+    return news_scraper.get_http_cache().contains(url=BASE_URL + path)
+
+def test_small_html_page_is_cached(news_scraper):
+    assert fetched_text(news_scraper, '/cacheable-small') == TEXT
+    assert is_cached(news_scraper, '/cacheable-small')
+
+def test_oversized_page_is_truncated_and_not_cached(news_scraper):
+    root = news_scraper.fetch_html_tree(BASE_URL + '/cacheable-large')
+    assert news_scraper.element_text(root.find('.//p')) == 'start'
+    assert not is_cached(news_scraper, '/cacheable-large')
+
+def test_non_html_page_is_skipped_and_not_cached(news_scraper):
+    assert news_scraper.fetch_html_tree(BASE_URL + '/cacheable-pdf') is None
+    assert not is_cached(news_scraper, '/cacheable-pdf')
+
+def legislation_text(legislation_scraper, path: str) -> str:
+    tree = legislation_scraper.LexborHTMLParser(legislation_scraper.fetch_html(BASE_URL + path))
+    return legislation_scraper.node_text(tree.css_first('p'))
+
+def test_legislation_utf8_page_without_meta_charset(legislation_scraper):
+    assert legislation_text(legislation_scraper, '/utf8-no-meta') == TEXT
+
+def test_legislation_windows_1252_page_with_meta_charset(legislation_scraper):
+    assert legislation_text(legislation_scraper, '/cp1252-meta') == TEXT
+
+def test_legislation_windows_1252_page_with_header_charset(legislation_scraper):
+    assert legislation_text(legislation_scraper, '/cp1252-header') == TEXT
+
+def test_legislation_undeclared_non_utf8_page_is_read_as_windows_1252(legislation_scraper):
+    assert legislation_text(legislation_scraper, '/cp1252-undeclared') == TEXT
@@ -0,0 +1,46 @@
+"""
+Keyword Matching Tests
+Checks that news_scraper's single-pass keyword scan (scan_keywords,
+news_keywords_in, matches_keywords) agrees with the per-keyword regex
+matching in article_tagger.get_matched_keywords, including its whole-word
+rule.
+"""
+
+import random
+
+from article_tagger import get_matched_keywords
+
+# Keywords, near misses that contain a keyword inside a longer word, and
+# punctuation / non-ASCII word characters around which boundaries are judged
+TOKENS = ['war', 'software', 'oil', 'toilet', 'AI', 'said', 'é', 'İ', 'gas', '-', '.',
+          "Moody's", "Standard & Poor's", 'energy', 'solar', 'power', 'Solar Power',
+          'climate risk', 'DOE', 'x', 'Bloomberg', '_', '\n', 'ΣΑΣ']
+
+def random_text(rng: random.Random, max_tokens: int) -> str:
+    return ' '.join(rng.choice(TOKENS) for _ in range(rng.randint(0, max_tokens)))
+
+def test_scan_matches_regex_reference(news_scraper):
+    keywords = news_scraper.NEWS_KEYWORDS
+    rng = random.Random(5)
+    for _ in range(5000):
+        title, content = random_text(rng, 4), random_text(rng, 12)
+        combined = title + ' ' + content
+        found = news_scraper.scan_keywords(combined)
+
+        # Tags: same keywords, in NEWS_KEYWORDS order
+        assert news_scraper.news_keywords_in(found) == get_matched_keywords(combined, keywords), combined
+
+        # Content gate used by direct scraping: a hit past the title
+        content_start = len(title.lower()) + 1
+        gate = any(start >= content_start for start in found.values())
+        assert gate == bool(get_matched_keywords(content, keywords)), combined
+        assert news_scraper.matches_keywords(content) == gate, combined
+
+def test_keyword_inside_longer_word_does_not_match(news_scraper):
+    assert not news_scraper.matches_keywords('software update')
+    assert 'war' not in news_scraper.scan_keywords('software update')
+    assert get_matched_keywords('software update', news_scraper.NEWS_KEYWORDS) == []
+
+def test_whole_word_keyword_matches(news_scraper):
+    assert news_scraper.matches_keywords('a war began')
+    assert news_scraper.news_keywords_in(news_scraper.scan_keywords('a war began')) == ['war']
@@ -0,0 +1,43 @@
+"""
+Processed Article Window Tests
+Checks that news_scraper only treats articles from the look-back window of
+date folders as processed, and that the on-disk filter cache drops dates
+that left the window and ignores caches in an older format.
+"""
+
+import pickle
+from unittest import mock
+
+def test_lookback_window_starts_today(news_scraper):
+    dates = news_scraper.lookback_dates()
+    assert dates[0] == news_scraper.today
+    assert len(dates) == news_scraper.PROCESSED_LOOKBACK_DAYS
+    assert dates == sorted(dates, reverse=True)
+
+def test_processed_hashes_cover_every_date_and_add_to_today(news_scraper):
+    yesterday = news_scraper.lookback_dates()[1]
+    old = news_scraper.new_processed_filter()
+    old.add('abc')
+    processed = news_scraper.ProcessedHashes({yesterday: old})
+
+    processed.add('def')
+    assert 'abc' in processed and 'def' in processed
+    assert 'def' in processed.filters[news_scraper.today]
+    assert len(processed) == 2
+
+def test_cache_drops_dates_outside_window(news_scraper, tmp_path):
+    cache_file = tmp_path / 'cache.pkl'
+    inside, outside = news_scraper.lookback_dates()[-1], '2000-01-01'
+    filters = {date_str: news_scraper.new_processed_filter() for date_str in (inside, outside, news_scraper.today)}
+
+    with mock.patch.object(news_scraper, 'S3_MANIFEST_CACHE_FILE', str(cache_file)):
+        news_scraper.save_manifest_cache(filters)
+        # Today's folder still changes, so it is never cached
+        assert set(news_scraper.load_manifest_cache()) == {inside}
+
+def test_cache_in_old_format_is_ignored(news_scraper, tmp_path):
+    cache_file = tmp_path / 'cache.pkl'
+    cache_file.write_bytes(pickle.dumps({'article_hashes': set(), 'latest_date': '2025-01-01'}))
+
+    with mock.patch.object(news_scraper, 'S3_MANIFEST_CACHE_FILE', str(cache_file)):
+        assert news_scraper.load_manifest_cache() == {}
@@ -3,6 +3,7 @@
 Fix duplicate cards in index.html
 """
 import boto3
+import gzip
 import re
 from bs4 import BeautifulSoup
 
@@ -13,10 +14,14 @@ def fix_duplicate_cards():
     
     # Download current index.html
     response = s3.get_object(Bucket=bucket_name, Key='index.html')
-    html_content = response['Body'].read().decode('utf-8')
+    html_body = response['Body'].read()
+    # news_scraper.py stores the master index gzipped
+    if response.get('ContentEncoding') == 'gzip':
+        html_body = gzip.decompress(html_body)
+    html_content = html_body.decode('utf-8')
     
     # Parse HTML
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, 'lxml')
     
     # Find all news cards
     news_cards = soup.find_all('article', {'data-type': 'news'})
@@ -53,8 +58,10 @@ def fix_duplicate_cards():
         s3.put_object(
             Bucket=bucket_name,
             Key='index.html',
-            Body=fixed_html.encode('utf-8'),
-            ContentType='text/html'
+            Body=gzip.compress(fixed_html.encode('utf-8'), compresslevel=6),
+            ContentType='text/html',
+            ContentEncoding='gzip',
+            CacheControl='public, max-age=300'
         )
         print("Successfully uploaded fixed HTML to S3")
     except Exception as e:
@@ -97,8 +104,10 @@ def fix_duplicate_cards():
         s3.put_object(
             Bucket=bucket_name,
             Key='index.html',
-            Body=fixed_html.encode('utf-8'),
-            ContentType='text/html'
+            Body=gzip.compress(fixed_html.encode('utf-8'), compresslevel=6),
+            ContentType='text/html',
+            ContentEncoding='gzip',
+            CacheControl='public, max-age=300'
         )
         print("Successfully uploaded fixed HTML using fallback method")
     
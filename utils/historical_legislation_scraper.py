@@ -9,25 +9,26 @@ and saves them to a historical subfolder for a one-time historical collection pa
 import os
 import re
 import json
-import time
 import logging
-import requests
-import hashlib
 import sys
 from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse, quote
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from concurrent.futures import ThreadPoolExecutor
 
 # Import shared storage utilities
 from news_storage import (
     save_article,
-    exists_in_s3,
+    url_hash,
+    legacy_url_hash,
     S3_BUCKET_NAME,
     s3_client,
-    upload_to_s3_if_not_exists
+    upload_to_s3_if_not_exists,
+    upload_article_content
 )
+from news_fetch import http_get, node_text, decode_html, fetch_html
 from article_tagger import detect_continents
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -62,21 +63,25 @@ LEGISLATION_RSS_FEEDS = [
     'https://www12.senado.leg.br/noticias/rss',
 ]
 
-# Track processed URLs
+# Track processed URLs, by article ID (the url_hash of the URL that
+# save_historical_article also uses as the metadata file name)
 processed_urls = set()
 
 def url_already_processed(url: str) -> bool:
     """Check if URL was already processed"""
-    return url in processed_urls
+    return url_hash(url) in processed_urls or legacy_url_hash(url) in processed_urls
 
 def add_processed_url(url: str):
     """Add URL to processed set"""
-    processed_urls.add(url)
+    processed_urls.add(url_hash(url))
 
 def load_processed_urls():
-    """Load processed URLs from S3 metadata files"""
-    global processed_urls
+    """
+    Load processed article IDs from one listing of the historical metadata folder.
     
+    Metadata files are named <article_id>.json, so no metadata object has to be
+    downloaded.
+    """
     try:
         paginator = s3_client.get_paginator('list_objects_v2')
         pages = paginator.paginate(
@@ -89,15 +94,9 @@ def load_processed_urls():
                 continue
             
             for obj in page['Contents']:
-                if obj['Key'].endswith('.json'):
-                    try:
-                        response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=obj['Key'])
-                        metadata = json.loads(response['Body'].read().decode('utf-8'))
-                        if 'url' in metadata:
-                            processed_urls.add(metadata['url'])
-                    except Exception as e:
-                        logger.debug(f"Error loading metadata {obj['Key']}: {e}")
-                        continue
+                key = obj['Key']
+                if key.endswith('.json'):
+                    processed_urls.add(key.rsplit('/', 1)[-1][:-len('.json')])
         
         logger.info(f"Loaded {len(processed_urls)} processed URLs from S3")
     except Exception as e:
@@ -109,10 +108,6 @@ load_processed_urls()
 def extract_full_article_content(url: str) -> Optional[str]:
     """Extract full article content from URL"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
         # Special handling for govinfo.gov - extract bill ID and get XML/HTML content
         if 'govinfo.gov/app/details/' in url:
             # Extract bill ID from URL (e.g., BILLS-119hr5853ih from /app/details/BILLS-119hr5853ih)
@@ -121,7 +116,7 @@ def extract_full_article_content(url: str) -> Optional[str]:
                 # Try XML first (cleanest format)
                 xml_url = f"https://www.govinfo.gov/content/pkg/{bill_id}/xml/{bill_id}.xml"
                 try:
-                    xml_response = requests.get(xml_url, headers=headers, timeout=30)
+                    xml_response = http_get(xml_url, timeout=30)
                     if xml_response.status_code == 200 and len(xml_response.content) > 1000:
                         # Parse XML and convert to HTML-like structure
                         soup = BeautifulSoup(xml_response.content, 'xml')
@@ -135,40 +130,32 @@ def extract_full_article_content(url: str) -> Optional[str]:
                 # Fallback to HTML version
                 html_url = f"https://www.govinfo.gov/content/pkg/{bill_id}/html/{bill_id}.htm"
                 try:
-                    html_response = requests.get(html_url, headers=headers, timeout=30)
+                    html_response = http_get(html_url, timeout=30)
                     if html_response.status_code == 200 and len(html_response.content) > 1000:
-                        soup = BeautifulSoup(html_response.content, 'html.parser')
+                        tree = LexborHTMLParser(decode_html(html_response, html_response.content))
                         # Get the body content
-                        body = soup.find('body')
-                        if body:
-                            return str(body)
+                        if tree.body:
+                            return tree.body.html
                 except Exception as e:
                     logger.debug(f"Could not get HTML for {bill_id}: {e}")
         
         # Special handling for Brazilian Senate (senado.leg.br) - extract from #textoMateria
         if 'senado.leg.br' in url:
             try:
-                response = requests.get(url, headers=headers, timeout=30)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                tree = LexborHTMLParser(fetch_html(url, timeout=30) or '')
                 
-                # Remove scripts and styles
-                for script in soup(["script", "style"]):
-                    script.decompose()
+                # Remove scripts and styles in one pass
+                tree.strip_tags(["script", "style"])
                 
                 # Get article content from #textoMateria
-                texto_materia = soup.select_one('#textoMateria')
+                texto_materia = tree.css_first('#textoMateria')
                 if texto_materia:
                     # Get title from #materia > h1 if available
-                    materia = soup.select_one('#materia')
-                    title = ''
-                    if materia:
-                        title_elem = materia.find('h1')
-                        if title_elem:
-                            title = title_elem.get_text(strip=True)
+                    title_elem = tree.css_first('#materia h1')
+                    title = node_text(title_elem) if title_elem else ''
                     
                     # Get content text
-                    content_text = texto_materia.get_text(separator='\n', strip=True)
+                    content_text = node_text(texto_materia, separator='\n')
                     
                     # Build HTML structure
                     body_content = f"<body><div class='senado-content'><h1>{title}</h1><div id='textoMateria'>{content_text}</div></div></body>"
@@ -178,14 +165,14 @@ def extract_full_article_content(url: str) -> Optional[str]:
                 logger.debug(f"Could not extract senado.leg.br content: {e}")
         
         # Standard extraction for other URLs
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        html = fetch_html(url, timeout=30)
+        if not html:
+            return None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = LexborHTMLParser(html)
         
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        # Remove script and style elements in one pass
+        tree.strip_tags(["script", "style"])
         
         # Try to find main article content
         article_selectors = [
@@ -200,16 +187,16 @@ def extract_full_article_content(url: str) -> Optional[str]:
         
         content = None
         for selector in article_selectors:
-            content = soup.select_one(selector)
+            content = tree.css_first(selector)
             if content:
                 break
         
         if not content:
             # Fallback: use body
-            content = soup.find('body')
+            content = tree.body
         
         if content:
-            return str(content)
+            return content.html
         
         return None
         
@@ -221,7 +208,7 @@ def save_historical_article(title: str, url: str, pub_date: str, description: st
                            full_content: str, feed_url: str, tags: Dict) -> Optional[str]:
     """Save article to historical folder"""
     # Generate unique ID from URL
-    article_id = hashlib.md5(url.encode()).hexdigest()
+    article_id = url_hash(url)
     
     # Create metadata
     metadata = {
@@ -240,37 +227,74 @@ def save_historical_article(title: str, url: str, pub_date: str, description: st
     metadata_key = f"{HISTORICAL_FOLDER}/metadata/{article_id}.json"
     content_key = f"{HISTORICAL_FOLDER}/content/{article_id}.html"
     
-    # Check if already exists
-    if exists_in_s3(metadata_key) and exists_in_s3(content_key):
-        logger.debug(f"Article already exists: {article_id}")
-        return None
-    
-    # Save metadata
-    if upload_to_s3_if_not_exists(
+    # Save full content first: the metadata marks the article as processed,
+    # so it is only written once the content is stored
+    if upload_article_content(full_content, content_key) and upload_to_s3_if_not_exists(
         json.dumps(metadata, indent=2).encode("utf-8"),
         metadata_key,
         "application/json"
     ):
-        # Save full content
-        if upload_to_s3_if_not_exists(
-            full_content.encode('utf-8'),
-            content_key
-        ):
-            logger.info(f"✓ Saved article: {title[:50]}...")
-            return article_id
+        logger.info(f"✓ Saved article: {title[:50]}...")
+        return article_id
     
     return None
 
+# Article downloads from every feed share one bounded pool; http_get keeps at
+# most news_fetch.HOST_MAX_CONCURRENCY requests in flight per host instead of
+# a fixed sleep
+ARTICLE_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+def save_historical_item(feed_url: str, title: str, link: str, pub_date: str, description: str) -> int:
+    """Fetch, tag and save one feed item (runs on ARTICLE_EXECUTOR); returns 1 if saved"""
+    try:
+        # Extract full article content
+        full_content = extract_full_article_content(link)
+        if not full_content:
+            logger.warning(f"Could not extract content from: {link}")
+            return 0
+        
+        # Tag the article
+        combined_text = title + ' ' + description + ' ' + full_content
+        
+        tags = {
+            'continents': detect_continents(combined_text),
+            'matched_keywords': [],  # No keyword matching for legislation
+            'core_topics': []  # No topic matching for legislation
+        }
+        
+        # Always add legislation tag
+        special_tags = ['legislation']
+        enhanced_tags = {
+            **tags,
+            'special_tags': special_tags
+        }
+        
+        # Save article to historical folder
+        article_id = save_historical_article(
+            title=title,
+            url=link,
+            pub_date=pub_date,
+            description=description,
+            full_content=full_content,
+            feed_url=feed_url,
+            tags=enhanced_tags
+        )
+        
+        if article_id:
+            add_processed_url(link)
+            logger.info(f"✓ Saved historical legislation article: {title[:50]}...")
+            return 1
+        return 0
+    except Exception as e:
+        logger.debug(f"Error processing RSS item: {str(e)}")
+        return 0
+
 def process_single_historical_feed(feed_url: str):
     """Process a single legislation RSS feed - NO DATE FILTERING"""
     logger.info(f"Processing historical legislation RSS feed: {feed_url}")
-    feed_count = 0
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(feed_url, headers=headers, timeout=30)
+        response = http_get(feed_url, timeout=30)
         response.raise_for_status()
         
         # Parse RSS
@@ -287,6 +311,8 @@ def process_single_historical_feed(feed_url: str):
         
         logger.info(f"Found {len(items)} items in feed: {feed_url}")
         
+        futures = []
+        seen_links = set()  # links already queued from this feed
         for item in items:
             try:
                 # Extract title
@@ -320,7 +346,7 @@ def process_single_historical_feed(feed_url: str):
                 elif item.find('content'):
                     description = item.find('content').get_text()
                 
-                if not link:
+                if not link or link in seen_links:
                     continue
                 
                 # Check if already processed
@@ -330,50 +356,17 @@ def process_single_historical_feed(feed_url: str):
                 
                 # NO DATE FILTERING - collect all articles
                 
-                # Extract full article content
-                full_content = extract_full_article_content(link)
-                if not full_content:
-                    logger.warning(f"Could not extract content from: {link}")
-                    continue
-                
-                # Tag the article
-                combined_text = title + ' ' + description + ' ' + full_content
-                
-                tags = {
-                    'continents': detect_continents(combined_text),
-                    'matched_keywords': [],  # No keyword matching for legislation
-                    'core_topics': []  # No topic matching for legislation
-                }
-                
-                # Always add legislation tag
-                special_tags = ['legislation']
-                enhanced_tags = {
-                    **tags,
-                    'special_tags': special_tags
-                }
-                
-                # Save article to historical folder
-                article_id = save_historical_article(
-                    title=title,
-                    url=link,
-                    pub_date=pub_date,
-                    description=description,
-                    full_content=full_content,
-                    feed_url=feed_url,
-                    tags=enhanced_tags
-                )
-                
-                if article_id:
-                    feed_count += 1
-                    add_processed_url(link)
-                    logger.info(f"✓ Saved historical legislation article: {title[:50]}...")
-                
-                time.sleep(0.5)  # Rate limiting
+                # Fetch, tag and save the article on the shared article pool
+                seen_links.add(link)
+                futures.append(ARTICLE_EXECUTOR.submit(
+                    save_historical_item, feed_url, title, link, pub_date, description
+                ))
                 
             except Exception as e:
                 logger.debug(f"Error processing RSS item: {str(e)}")
                 continue
         
+        feed_count = sum(future.result() for future in futures)
         logger.info(f"Completed feed: {feed_url} ({feed_count} articles)")
         return feed_count
         
@@ -11,9 +11,8 @@ This script:
 import json
 import logging
 import requests
-import hashlib
 from bs4 import BeautifulSoup
-from news_storage import S3_BUCKET_NAME, s3_client, upload_to_s3_if_not_exists
+from news_storage import S3_BUCKET_NAME, s3_client, upload_to_s3_if_not_exists, upload_article_content
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("update_govinfo_content")
@@ -50,7 +49,7 @@ def extract_govinfo_content(url: str) -> str:
     try:
         html_response = requests.get(html_url, headers=headers, timeout=30)
         if html_response.status_code == 200 and len(html_response.content) > 1000:
-            soup = BeautifulSoup(html_response.content, 'html.parser')
+            soup = BeautifulSoup(html_response.content, 'lxml')
             # Get the body content
             body = soup.find('body')
             if body:
@@ -91,7 +90,9 @@ def update_govinfo_articles():
                         'metadata_key': obj['Key'],
                         'url': url,
                         'title': metadata.get('title', 'Unknown'),
-                        'article_id': hashlib.md5(url.encode()).hexdigest()
+                        # The metadata file name is the article ID (md5 or
+                        # xxh128, depending on when the article was stored)
+                        'article_id': obj['Key'].split('/')[-1].replace('.json', '')
                     })
             except Exception as e:
                 logger.debug(f"Error loading metadata {obj['Key']}: {e}")
@@ -112,12 +113,9 @@ def update_govinfo_articles():
             
             # Upload content file
             content_key = f"{HISTORICAL_FOLDER}/content/{article['article_id']}.html"
-            s3_client.put_object(
-                Bucket=S3_BUCKET_NAME,
-                Key=content_key,
-                Body=content.encode('utf-8'),
-                ContentType='text/html'
-            )
+            if not upload_article_content(content, content_key):
+                failed_count += 1
+                continue
             
             # Update metadata with new content length
             response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=article['metadata_key'])
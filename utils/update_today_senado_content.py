@@ -19,6 +19,7 @@ if os.path.dirname(__file__) not in sys.path:
 
 # Import extraction function from historical scraper
 from historical_legislation_scraper import extract_full_article_content
+from news_storage import upload_article_content
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("update_today_senado_content")
@@ -92,12 +93,8 @@ def update_today_senado_articles():
             content_key = f"{TODAY_FOLDER}/content/{article_id}.html"
             
             # Upload updated content
-            s3_client.put_object(
-                Bucket=S3_BUCKET_NAME,
-                Key=content_key,
-                Body=content.encode('utf-8'),
-                ContentType='text/html'
-            )
+            if not upload_article_content(content, content_key):
+                continue
             
             # Update metadata with new content length
             metadata['content_length'] = len(content)